@@ -1,5 +1,19 @@
 """Gerenciador PostgreSQL core package."""
 
-from . import state_reader, reconciler, executor
+import importlib
 
 __all__ = ["state_reader", "reconciler", "executor"]
+
+
+def __getattr__(name):
+    # Submódulos carregados sob demanda (PEP 562): importar qualquer parte do
+    # pacote (ex.: a GUI) não executa mais state_reader/reconciler/executor.
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
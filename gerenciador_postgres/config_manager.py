@@ -1,3 +1,4 @@
+import copy
 import logging
 import os
 from pathlib import Path
@@ -28,15 +29,37 @@ DEFAULT_CONFIG = {
 logger = logging.getLogger(__name__)
 logger.propagate = True
 
+# Usa o parser em C (LibYAML) quando disponível; senão, o SafeLoader puro Python.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Última configuração lida, chaveada por (arquivo, mtime, tamanho): várias
+# telas chamam load_config() a cada ação e o arquivo quase nunca muda.
+_config_cache = None
+
+
+def _file_signature(path):
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
 def load_config():
+    global _config_cache
     if not CONFIG_FILE.exists():
         CONFIG_DIR.mkdir(exist_ok=True)
         with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
             yaml.safe_dump(DEFAULT_CONFIG, f, allow_unicode=True)
         return DEFAULT_CONFIG.copy()
+    signature = _file_signature(CONFIG_FILE)
+    cached = _config_cache
+    if cached is not None and signature is not None and cached[0] == signature:
+        # Cópia profunda: chamadores editam a lista 'databases' antes de salvar
+        return copy.deepcopy(cached[1])
     with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
         try:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YAML_LOADER) or {}
         except yaml.YAMLError as e:
             logger.warning("Failed to parse %s: %s", CONFIG_FILE, e)
             with open(CONFIG_FILE, 'w', encoding='utf-8') as fw:
@@ -49,9 +72,13 @@ def load_config():
         if not log_path_path.is_absolute():
             log_path_path = BASE_DIR / log_path_path
         result['log_path'] = str(log_path_path)
+    if signature is not None:
+        _config_cache = (signature, copy.deepcopy(result))
     return result
 
 def save_config(data):
+    global _config_cache
+    _config_cache = None
     CONFIG_DIR.mkdir(exist_ok=True)
     with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
         yaml.safe_dump(data, f, allow_unicode=True)
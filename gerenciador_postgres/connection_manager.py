@@ -21,7 +21,7 @@ from psycopg2.pool import SimpleConnectionPool
 from PyQt6.QtCore import QObject, pyqtSignal, QCoreApplication
 
 from .config_manager import load_config
-from .logger import setup_logger
+from .logger import ensure_logger
 
 
 logger = logging.getLogger(__name__)
@@ -83,11 +83,14 @@ PURE_MODE = os.getenv("CM_FORCE_QT", "").lower() not in {"1","true","yes"}
 
 class _DummySignal:
     def __init__(self):
-        self._slots = []
+        # Tupla imutável (copy-on-write): emit itera sem copiar nem travar
+        self._slots = ()
+        self._lock = threading.Lock()
     def connect(self, slot):
-        self._slots.append(slot)
+        with self._lock:
+            self._slots = self._slots + (slot,)
     def emit(self, *a, **k):
-        for s in list(self._slots):
+        for s in self._slots:
             try:
                 s(*a, **k)
             except Exception:
@@ -112,15 +115,25 @@ class ConnectionManager(QObject if not PURE_MODE else object):
 
     _instance: ConnectionManager | None = None
     _initialized = False
+    # Protege a criação/inicialização do singleton entre threads
+    _singleton_lock = threading.Lock()
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._singleton_lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
 
     def __init__(self) -> None:
         if self.__class__._initialized:
             return
+        with self.__class__._singleton_lock:
+            if self.__class__._initialized:
+                return
+            self._setup()
+
+    def _setup(self) -> None:
         logger.debug("[CM] __init__ início (PURE_MODE=%s)" % PURE_MODE)
         # Obtém instância existente de QApplication / QCoreApplication
         try:
@@ -155,6 +168,7 @@ class ConnectionManager(QObject if not PURE_MODE else object):
             pass
         # Dicionário de pools por nome de perfil
         self._pools = {}
+        self._pools_lock = threading.Lock()
         logger.debug("[CM] pools dict criado")
         self._thread_local = threading.local()
         logger.debug("[CM] thread_local criado")
@@ -177,8 +191,7 @@ class ConnectionManager(QObject if not PURE_MODE else object):
         *thread* para um determinado perfil obtém uma conexão do pool e as
         próximas chamadas reutilizam a mesma instância.
         """
-        if not logging.getLogger('app').handlers:
-            setup_logger()
+        ensure_logger()
 
         config = load_config()
         profiles = {db["name"]: db for db in config.get("databases", [])}
@@ -209,8 +222,12 @@ class ConnectionManager(QObject if not PURE_MODE else object):
 
         pool = self._pools.get(profile_name)
         if pool is None:
-            pool = SimpleConnectionPool(1, 10, **params)
-            self._pools[profile_name] = pool
+            # Duas threads conectando ao mesmo perfil não podem criar dois pools
+            with self._pools_lock:
+                pool = self._pools.get(profile_name)
+                if pool is None:
+                    pool = SimpleConnectionPool(1, 10, **params)
+                    self._pools[profile_name] = pool
 
         try:
             conn = pool.getconn()
@@ -232,8 +249,7 @@ class ConnectionManager(QObject if not PURE_MODE else object):
         Conecta ao PostgreSQL com suporte a connect_timeout (segundos).
         Ex.: host, port, dbname, user, password, sslmode, connect_timeout.
         """
-        if not logging.getLogger('app').handlers:
-            setup_logger()
+        ensure_logger()
 
         # Permite que chamadores passem o nome do perfil para resolução de senha
         profile_name = params.pop("profile_name", None)
@@ -265,6 +281,22 @@ class ConnectionManager(QObject if not PURE_MODE else object):
             logger.exception("Erro operacional ao conectar ao banco de dados")
             raise _friendly_error(e)
 
+    # ------------------------------------------------------------------
+    def open_dedicated(self, **params) -> connection:
+        """Abre uma conexão avulsa, fora do pool e do estado da *thread*.
+
+        Usada por tarefas em segundo plano que não podem dividir a conexão
+        da interface. Não emite ``connected``; o chamador deve fechá-la.
+        """
+        timeout = int(params.pop("connect_timeout", load_config().get("connect_timeout", 5)) or 5)
+        try:
+            conn = psycopg2.connect(connect_timeout=timeout, **params)
+        except OperationalError as e:
+            logger.exception("Erro operacional ao abrir conexão dedicada")
+            raise _friendly_error(e)
+        conn.autocommit = False
+        return conn
+
     # ------------------------------------------------------------------
     def get_connection(self) -> connection:
         """Retorna a conexão ativa da *thread*, garantindo que esteja aberta."""
@@ -1,27 +1,114 @@
-from PyQt6.QtCore import QObject, pyqtSignal
+import logging
+import threading
+import time
+
+import psycopg2
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 from config.permission_templates import PERMISSION_TEMPLATES
 
+from ..db_manager import DBManager
+from ..role_manager import RoleManager
+
+logger = logging.getLogger(__name__)
+
+# Default compartilhado para schemas sem privilégios futuros do grupo (somente leitura)
+_EMPTY_PRIVS = frozenset()
+
+# Validade (segundos) da leitura de pg_default_acl reaproveitada entre grupos
+DEFAULT_PRIVS_TTL = 30.0
+GROUPS_CACHE_TTL = 15.0
+
 
 class DependencyWarning(RuntimeError):
     """Sinaliza que a operação requer REVOKE ... CASCADE."""
 
 
+class _SweepSignals(QObject):
+    # (grupo, sucesso, mensagem de erro; vazia quando não houve exceção)
+    finished = pyqtSignal(str, bool, str)
+
+
+class _SweepJob(QRunnable):
+    """Executa ``sweep_privileges`` em uma thread do ``QThreadPool``.
+
+    ``QRunnable`` não é ``QObject``; o resultado é publicado por ``signals``,
+    criado na thread da interface para que a entrega seja enfileirada nela.
+
+    O sweep roda em uma conexão própria, obtida de ``connection_factory`` e
+    fechada aqui: a conexão da interface não pode ser usada por duas threads.
+    """
+
+    def __init__(self, role_manager, group_name: str, connection_factory):
+        super().__init__()
+        self.role_manager = role_manager
+        self.group_name = group_name
+        self.connection_factory = connection_factory
+        self.signals = _SweepSignals()
+
+    def run(self):
+        conn = None
+        error = ""
+        try:
+            conn = self.connection_factory()
+            # Sem audit_manager: o da interface está ligado à conexão da UI
+            role_manager = RoleManager(
+                DBManager(conn),
+                self.role_manager.logger,
+                operador=self.role_manager.operador,
+            )
+            success = bool(role_manager.sweep_privileges(target_group=self.group_name))
+        except Exception as e:
+            logger.exception("Falha no sweep assíncrono do grupo '%s'", self.group_name)
+            success = False
+            error = str(e)
+        finally:
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    logger.warning("Falha ao fechar a conexão do sweep de '%s'", self.group_name)
+        self.signals.finished.emit(self.group_name, success, error)
+
+
 class GroupsController(QObject):
     """Controller dedicado às operações de grupos e privilégios."""
 
     data_changed = pyqtSignal()
+    # (grupo, sucesso, mensagem de erro; vazia quando não houve exceção)
+    sweep_finished = pyqtSignal(str, bool, str)
 
-    def __init__(self, role_manager):
+    def __init__(self, role_manager, connection_factory=None):
         super().__init__()
         self.role_manager = role_manager
-        self._is_refreshing = False
-        self._is_applying = False
+        # Abre conexões próprias para os sweeps em segundo plano
+        self.connection_factory = connection_factory
+        self._dbname = None
+        # Travas de reentrância (tentativa não bloqueante): seguras entre threads
+        self._refresh_lock = threading.Lock()
+        self._apply_lock = threading.Lock()
+        self._sweep_jobs: set[_SweepJob] = set()
+        # (expira_em, dados) da última leitura de default privileges de tabelas
+        self._default_privs_cache: tuple[float, dict] | None = None
+        # (expira_em, nomes) da última listagem de grupos
+        self._groups_cache: tuple[float, tuple[str, ...]] | None = None
+        self.data_changed.connect(self.invalidate_cache)
+
+    def invalidate_cache(self):
+        """Descarta leituras em cache; chamado a cada ``data_changed``."""
+        self._default_privs_cache = None
+        self._groups_cache = None
 
     # ---------------------------------------------------------------
     # Operações de grupos
     # ---------------------------------------------------------------
     def list_groups(self):
-        return self.role_manager.list_groups()
+        cached = self._groups_cache
+        now = time.monotonic()
+        if cached is None or now >= cached[0]:
+            cached = (now + GROUPS_CACHE_TTL, tuple(self.role_manager.list_groups()))
+            self._groups_cache = cached
+        # Cópia: as views podem ordenar/alterar a lista recebida
+        return list(cached[1])
 
     def create_group(self, group_name: str):
         result = self.role_manager.create_group(group_name)
@@ -55,34 +142,46 @@ class GroupsController(QObject):
     def get_schema_level_privileges(self, group_name: str):
         try:
             return self.role_manager.dao.get_schema_privileges(group_name)
-        except Exception:
+        except psycopg2.Error as e:
+            logger.warning("Erro ao consultar privilégios de schema de '%s': %s", group_name, e)
             return {}
 
     def get_default_table_privileges(self, group_name: str):
         """Retorna privilégios futuros com informação de owner.
 
-        Evita reentrância usando ``_is_refreshing`` para ignorar chamadas
+        Evita reentrância usando ``_refresh_lock`` para ignorar chamadas
         simultâneas.
         """
-        if self._is_refreshing:
+        if not self._refresh_lock.acquire(blocking=False):
             return {}
-        self._is_refreshing = True
         try:
-            data = self.role_manager.dao.get_default_privileges(objtype="r")
-        except Exception:
+            data = self._table_default_privileges()
+        except psycopg2.Error as e:
+            logger.warning("Erro ao consultar default privileges de '%s': %s", group_name, e)
             data = {}
         finally:
-            self._is_refreshing = False
+            self._refresh_lock.release()
 
-        meta = data.pop("_meta", {})
+        # ``data`` é tratado como somente leitura: o DAO pode reaproveitá-lo
+        meta = data.get("_meta", {})
         owners = meta.get("owner_roles", {})
-        result = {}
-        for schema, grants in data.items():
-            result[schema] = {
+        return {
+            schema: {
                 "owner": owners.get(schema),
-                "privileges": grants.get(group_name, set()),
+                "privileges": grants.get(group_name, _EMPTY_PRIVS),
             }
-        return result
+            for schema, grants in data.items()
+            if schema != "_meta"
+        }
+
+    def _table_default_privileges(self) -> dict:
+        cached = self._default_privs_cache
+        now = time.monotonic()
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        data = self.role_manager.dao.get_default_privileges(objtype="r")
+        self._default_privs_cache = (now + DEFAULT_PRIVS_TTL, data)
+        return data
 
     def list_privilege_templates(self):
         return PERMISSION_TEMPLATES
@@ -108,8 +207,11 @@ class GroupsController(QObject):
             if "[WARN-DEPEND]" in str(e):
                 raise DependencyWarning(str(e))
             raise
-        if success and emit_signal:
-            self.data_changed.emit()
+        if success:
+            # Pode ter ajustado default privileges (união dos privilégios)
+            self.invalidate_cache()
+            if emit_signal:
+                self.data_changed.emit()
         return success
 
     def apply_template_to_group(self, group_name: str, template: str):
@@ -160,9 +262,8 @@ class GroupsController(QObject):
         Após aplicar, dispara ``data_changed`` para que a interface possa
         reconsultar o estado atualizado.
         """
-        if self._is_applying:
+        if not self._apply_lock.acquire(blocking=False):
             return False
-        self._is_applying = True
         try:
             kwargs = {"for_role": owner} if owner else {}
             try:
@@ -174,21 +275,17 @@ class GroupsController(QObject):
                     raise DependencyWarning(str(e))
                 raise
             if success:
-                # READ-BACK: reconsulta apenas os defaults do grupo/objeto-alvo
-                code_map = {"tables": "r", "sequences": "S", "functions": "f", "types": "T"}
-                code = code_map.get(obj_type, "r")
-                try:
-                    self.role_manager.dao.get_default_privileges(owner=owner, objtype=code)
-                except Exception:
-                    pass
+                self.invalidate_cache()
                 if emit_signal:
+                    # A interface reconsulta o estado ao receber ``data_changed``
                     self.data_changed.emit()
             return success
         finally:
-            self._is_applying = False
+            self._apply_lock.release()
 
     def get_current_database(self):
-        return self.role_manager.dao.conn.get_dsn_parameters().get("dbname")
+        # O DAO guarda o nome do banco por conexão
+        return self.role_manager.dao.dbname
 
     # ---------------------------------------------------------------
     # Sincronização (sweep) de privilégios
@@ -204,3 +301,33 @@ class GroupsController(QObject):
         if success:
             self.data_changed.emit()
         return success
+
+    def sweep_group_privileges_async(self, group_name: str) -> None:
+        """Dispara o sweep do grupo no ``QThreadPool`` global e retorna imediatamente.
+
+        O término é sinalizado por ``sweep_finished(grupo, sucesso, erro)``;
+        em caso de sucesso ``data_changed`` também é emitido. Sem
+        ``connection_factory`` não há conexão própria para a thread, então o
+        sweep roda de forma síncrona na thread da interface.
+        """
+        if self.connection_factory is None:
+            try:
+                success, error = self.sweep_group_privileges(group_name), ""
+            except Exception as e:
+                logger.exception("Falha no sweep do grupo '%s'", group_name)
+                success, error = False, str(e)
+            self.sweep_finished.emit(group_name, success, error)
+            return
+        job = _SweepJob(self.role_manager, group_name, self.connection_factory)
+        job.setAutoDelete(False)
+        job.signals.finished.connect(
+            lambda group, ok, error, job=job: self._on_sweep_finished(job, group, ok, error)
+        )
+        self._sweep_jobs.add(job)
+        QThreadPool.globalInstance().start(job)
+
+    def _on_sweep_finished(self, job: _SweepJob, group_name: str, success: bool, error: str):
+        self._sweep_jobs.discard(job)
+        if success:
+            self.data_changed.emit()
+        self.sweep_finished.emit(group_name, success, error)
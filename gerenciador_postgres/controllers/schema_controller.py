@@ -1,5 +1,9 @@
+import time
+
 from PyQt6.QtCore import QObject, pyqtSignal
 
+SCHEMAS_CACHE_TTL = 15.0
+
 
 class SchemaController(QObject):
     """Controller que orquestra as operações de schema."""
@@ -10,9 +14,22 @@ class SchemaController(QObject):
         super().__init__()
         self.schema_manager = schema_manager
         self.logger = logger
+        # (expira_em, nomes) da última listagem de schemas
+        self._schemas_cache: tuple[float, tuple[str, ...]] | None = None
+        self.data_changed.connect(self.invalidate_cache)
+
+    def invalidate_cache(self):
+        """Descarta a listagem de schemas em cache; chamado a cada ``data_changed``."""
+        self._schemas_cache = None
 
     def list_schemas(self):
-        return self.schema_manager.list_schemas()
+        cached = self._schemas_cache
+        now = time.monotonic()
+        if cached is None or now >= cached[0]:
+            cached = (now + SCHEMAS_CACHE_TTL, tuple(self.schema_manager.list_schemas()))
+            self._schemas_cache = cached
+        # Cópia: as views podem ordenar/alterar a lista recebida
+        return list(cached[1])
 
     def list_roles(self):
         return self.schema_manager.list_roles()
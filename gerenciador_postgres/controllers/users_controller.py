@@ -1,4 +1,12 @@
-from PyQt6.QtCore import QObject, pyqtSignal
+import time
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+# Janela (ms) em que várias notificações seguidas viram uma só
+EMIT_DEBOUNCE_MS = 50
+
+# Validade (segundos) da lista de usuários compartilhada entre as telas
+USERS_CACHE_TTL = 15.0
 
 
 class UsersController(QObject):
@@ -10,20 +18,64 @@ class UsersController(QObject):
     """
 
     data_changed = pyqtSignal()
+    # Emitido (uma vez por grupo) quando membros de um grupo mudam
+    members_changed = pyqtSignal(str)
 
     def __init__(self, role_manager):
         super().__init__()
         self.role_manager = role_manager
+        # Notificações pendentes, agrupadas até o próximo disparo do timer
+        self._data_dirty = False
+        self._dirty_groups: set[str] = set()
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(EMIT_DEBOUNCE_MS)
+        self._emit_timer.timeout.connect(self._flush_emits)
+        # (expira_em, usernames) da última listagem de usuários
+        self._users_cache: tuple[float, tuple[str, ...]] | None = None
+
+    # ------------------------------------------------------------------
+    # Notificações agrupadas
+    # ------------------------------------------------------------------
+    def _schedule_data_changed(self):
+        """Agenda ``data_changed``; chamadas em sequência geram um único sinal."""
+        # O cache é descartado já, antes do sinal, para que nenhuma leitura
+        # feita até o disparo do timer devolva a lista antiga
+        self._users_cache = None
+        self._data_dirty = True
+        self._emit_timer.start()
+
+    def invalidate_cache(self):
+        """Descarta a lista de usuários em cache (ex.: após SQL do console)."""
+        self._users_cache = None
+
+    def _schedule_members_changed(self, *group_names: str):
+        self._dirty_groups.update(group_names)
+        self._emit_timer.start()
+
+    def _flush_emits(self):
+        groups, self._dirty_groups = self._dirty_groups, set()
+        for group in sorted(groups):
+            self.members_changed.emit(group)
+        if self._data_dirty:
+            self._data_dirty = False
+            self.data_changed.emit()
 
     # ------------------------------------------------------------------
     # Operações de usuário
     # ------------------------------------------------------------------
     def list_users(self):
-        return self.role_manager.list_users()
+        cached = self._users_cache
+        now = time.monotonic()
+        if cached is None or now >= cached[0]:
+            cached = (now + USERS_CACHE_TTL, tuple(self.role_manager.list_users()))
+            self._users_cache = cached
+        # Cópia: as views podem ordenar/alterar a lista recebida
+        return list(cached[1])
 
     def create_user(self, username: str, password: str, valid_until: str | None = None):
         result = self.role_manager.create_user(username, password, valid_until)
-        self.data_changed.emit()
+        self._schedule_data_changed()
         return result
 
     def get_user(self, username: str):
@@ -51,19 +103,21 @@ class UsersController(QObject):
         results = self.role_manager.create_users_batch(
             users_data, valid_until, group_name, renew
         )
-        self.data_changed.emit()
+        self._schedule_data_changed()
+        if group_name:
+            self._schedule_members_changed(group_name)
         return results
 
     def renew_user_validity(self, username: str, new_date: str) -> bool:
         success = self.role_manager.renew_user_validity(username, new_date)
         if success:
-            self.data_changed.emit()
+            self._schedule_data_changed()
         return success
 
     def delete_user(self, username: str) -> bool:
         success = self.role_manager.delete_user(username)
         if success:
-            self.data_changed.emit()
+            self._schedule_data_changed()
         return success
 
     def change_password(self, username: str, password: str) -> bool:
@@ -80,19 +134,30 @@ class UsersController(QObject):
 
     def add_user_to_group(self, username: str, group_name: str) -> bool:
             """Adiciona usuário a um grupo sem emitir data_changed (preserva seleção na UI)."""
-            return self.role_manager.add_user_to_group(username, group_name)
+            success = self.role_manager.add_user_to_group(username, group_name)
+            if success:
+                self._schedule_members_changed(group_name)
+            return success
 
     def remove_user_from_group(self, username: str, group_name: str) -> bool:
             """Remove usuário de um grupo sem emitir data_changed."""
-            return self.role_manager.remove_user_from_group(username, group_name)
+            success = self.role_manager.remove_user_from_group(username, group_name)
+            if success:
+                self._schedule_members_changed(group_name)
+            return success
 
     def transfer_user_group(self, username: str, old_group: str, new_group: str) -> bool:
             """Transfere usuário de old_group para new_group (remove + adiciona)."""
-            return self.role_manager.transfer_user_group(username, old_group, new_group)
+            success = self.role_manager.transfer_user_group(username, old_group, new_group)
+            if success:
+                self._schedule_members_changed(old_group, new_group)
+            return success
 
     # --------------------------------------------------------------
-    # Compat: algumas views podem chamar flush(); aqui não há buffer,
-    # as operações já comitam imediatamente. Mantemos no-op.
+    # Compat: algumas views podem chamar flush(); as operações já comitam
+    # imediatamente, então só resta disparar as notificações pendentes.
     def flush(self):
+        self._emit_timer.stop()
+        self._flush_emits()
         return None
 
@@ -2,14 +2,14 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class User:
     username: str
     oid: int
     valid_until: Optional[datetime]
     can_login: bool
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Group:
     group_name: str
     oid: int
@@ -1,16 +1,28 @@
 import psycopg2
 from psycopg2 import sql
-from psycopg2.extensions import connection
+from psycopg2.extensions import (
+    TRANSACTION_STATUS_IDLE,
+    TRANSACTION_STATUS_INERROR,
+    connection,
+)
 from contextlib import contextmanager
+from operator import itemgetter
 from .data_models import User, Group
-from typing import Optional, List, Dict, Set, Callable
+from typing import Optional, List, Dict, Set, FrozenSet, Callable
+import functools
 import logging
+import sys
+import weakref
+from types import MappingProxyType
 
 from contracts.permission_contract import filter_managed
 
 logger = logging.getLogger(__name__)
 logger.propagate = True
 
+# Primeira coluna de cada linha (listas de nomes): map em C, sem loop Python
+_first_column = itemgetter(0)
+
 
 PRIVILEGE_WHITELIST = {
     "DATABASE": {"CREATE", "CONNECT", "TEMPORARY"},
@@ -32,25 +44,124 @@ PG_PRIVCODE_TO_NAME = {
     "t": "TRIGGER",
 }
 
+# Rótulos de privilégio ("SELECT", "SELECT*" com GRANT OPTION) internados:
+# cada linha lida do catálogo reaproveita a mesma string em vez de concatenar
+_PRIV_LABELS = {
+    (priv, grantable): sys.intern(priv + ("*" if grantable else ""))
+    for priv in set(PG_PRIVCODE_TO_NAME.values()).union(*PRIVILEGE_WHITELIST.values())
+    for grantable in (False, True)
+}
+
+
+def priv_label(priv: str, grantable: bool) -> str:
+    """Retorna o nome do privilégio, com ``*`` quando concedido com GRANT OPTION."""
+    try:
+        return _PRIV_LABELS[priv, bool(grantable)]
+    except KeyError:
+        return sys.intern(priv + ("*" if grantable else ""))
+
+
+def _debug_sql(label: str, stmt, cur) -> None:
+    """Registra ``stmt`` em DEBUG; só renderiza o SQL se o nível estiver ativo."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    try:
+        text = stmt.as_string(cur)
+    except Exception:
+        text = str(stmt)
+    logger.debug("%s: %s", label, text)
+
+
 # Supported object type identifiers for default privileges
-OBJECT_TYPES = {"tables", "sequences", "functions", "types"}
+OBJECT_TYPES = frozenset({"tables", "sequences", "functions", "types"})
 
 # Mapping between friendly names and SQL keywords used by ALTER DEFAULT PRIVILEGES
-OBJECT_TYPE_MAPS = {
+# (read-only views: shared by controllers and reconciler, built once at import)
+OBJECT_TYPE_MAPS = MappingProxyType({
     "tables": "TABLES",
     "sequences": "SEQUENCES",
     "functions": "FUNCTIONS",
     "types": "TYPES",
-}
+})
 
 # Mapping to pg_default_acl objtype codes used by get_default_privileges
-OBJECT_TYPE_CODES = {
+OBJECT_TYPE_CODES = MappingProxyType({
     "tables": "r",
     "sequences": "S",
     "functions": "f",
     "types": "T",
+})
+
+# SQLSTATE de EXECUTE para um nome que a sessão não conhece (invalid_sql_statement_name)
+_INVALID_STATEMENT_NAME = "26000"
+
+# Consultas frequentes preparadas uma vez por sessão (parâmetros posicionais $n)
+PREPARED_STATEMENTS = {
+    "find_user_by_name": """
+        SELECT rolname, oid, rolvaliduntil, rolcanlogin
+        FROM pg_roles
+        WHERE rolname = $1
+    """,
+    "list_group_members": """
+        SELECT u.rolname
+        FROM pg_auth_members m
+        JOIN pg_roles u ON m.member = u.oid
+        JOIN pg_roles g ON m.roleid = g.oid
+        WHERE g.rolname = $1
+        ORDER BY u.rolname
+    """,
+    "list_user_groups": """
+        SELECT g.rolname
+        FROM pg_auth_members m
+        JOIN pg_roles u ON m.member = u.oid
+        JOIN pg_roles g ON m.roleid = g.oid
+        WHERE u.rolname = $1
+        ORDER BY g.rolname
+    """,
+    "dashboard_counts": """
+        SELECT
+            (SELECT count(*) FROM pg_roles
+              WHERE rolcanlogin = true
+                AND rolname NOT LIKE 'pg\\_%'
+                AND rolname NOT LIKE 'rls\\_%'
+                AND rolname <> 'postgres'),
+            (SELECT count(*) FROM pg_roles
+              WHERE rolcanlogin = false
+                AND rolname LIKE $1),
+            (SELECT count(*) FROM information_schema.schemata
+              WHERE schema_name NOT LIKE 'pg_%'
+                AND schema_name <> 'information_schema'),
+            (SELECT count(*) FROM pg_class c
+              JOIN pg_namespace n ON n.oid = c.relnamespace
+              WHERE c.relkind = 'r'
+                AND n.nspname NOT LIKE 'pg_%'
+                AND n.nspname <> 'information_schema')
+    """,
 }
 
+# Modelos de comando montados uma vez no import; a cada chamada só os
+# identificadores são formatados
+_SQL_CREATE_USER = sql.SQL("CREATE ROLE {} WITH LOGIN PASSWORD %s")
+_SQL_CREATE_USER_UNTIL = sql.SQL("CREATE ROLE {} WITH LOGIN PASSWORD %s VALID UNTIL %s")
+_SQL_CREATE_GROUP = sql.SQL("CREATE ROLE {} NOLOGIN")
+_SQL_DROP_ROLE = sql.SQL("DROP ROLE {}")
+_SQL_GRANT_ROLE = sql.SQL("GRANT {} TO {}")
+_SQL_REVOKE_ROLE = sql.SQL("REVOKE {} FROM {}")
+_SQL_GRANT_ON = sql.SQL("GRANT {} ON {} {} TO {}")
+_SQL_REVOKE_ON = sql.SQL("REVOKE {} ON {} {} FROM {}")
+_SQL_LIST_SEP = sql.SQL(", ")
+_SQL_STATEMENT_SEP = sql.SQL("; ")
+
+
+@functools.lru_cache(maxsize=256)
+def _privilege_list(privs: FrozenSet[str]) -> sql.Composable:
+    """Lista ``PRIV1, PRIV2`` em ordem canônica, sem o ``*`` de GRANT OPTION.
+
+    Os mesmos conjuntos se repetem em todas as tabelas de um schema; a lista
+    composta é reaproveitada em vez de ordenada e montada a cada objeto.
+    """
+    return _SQL_LIST_SEP.join(sql.SQL(p.rstrip("*")) for p in sorted(privs))
+
 
 class DBManager:
     """Camada de acesso a dados para gerenciamento de roles e schemas."""
@@ -69,12 +180,31 @@ class DBManager:
             if not conn or not hasattr(conn, "cursor"):
                 raise ValueError("Conexão inválida para DBManager")
             self._conn_provider = lambda conn=conn: conn
+        # Nomes de statements já preparados em cada conexão (sessão)
+        self._prepared: "weakref.WeakKeyDictionary[connection, set[str]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Nome do banco de cada conexão (não muda durante a sessão)
+        self._dbnames: "weakref.WeakKeyDictionary[connection, str | None]" = (
+            weakref.WeakKeyDictionary()
+        )
 
     # ------------------------------------------------------------------
     @property
     def conn(self) -> connection:
         return self._conn_provider()
 
+    @property
+    def dbname(self) -> str | None:
+        """Nome do banco da conexão atual, lido uma única vez por conexão."""
+        conn = self.conn
+        try:
+            return self._dbnames[conn]
+        except KeyError:
+            name = conn.get_dsn_parameters().get("dbname")
+            self._dbnames[conn] = name
+            return name
+
     # ------------------------------------------------------------------
     def _reset_if_aborted(self):
         """Efetua rollback silencioso se a conexão estiver em estado de erro.
@@ -85,14 +215,53 @@ class DBManager:
         anteriores.
         """
         try:
-            from psycopg2 import extensions as _ext
             status = self.conn.get_transaction_status()
-            if status == _ext.TRANSACTION_STATUS_INERROR:
+            if status == TRANSACTION_STATUS_INERROR:
                 logger.warning("Transação anterior abortada detectada; executando rollback automático.")
                 self.conn.rollback()
         except Exception:
             pass
 
+    def _execute_prepared(self, conn: connection, cur, name: str, params: tuple):
+        """Executa um statement de ``PREPARED_STATEMENTS`` via ``EXECUTE``.
+
+        O ``PREPARE`` é emitido apenas na primeira chamada em cada conexão;
+        as seguintes reaproveitam o plano já analisado pelo servidor.
+
+        Se a sessão perdeu o statement (``DEALLOCATE``/``DISCARD ALL`` vindos
+        do console), o nome sai do registro e, fora de transação, o
+        ``PREPARE`` é refeito uma vez. Dentro de transação o erro é propagado,
+        pois o ``ROLLBACK`` descartaria o trabalho do chamador.
+        """
+        prepared = self._prepared.setdefault(conn, set())
+        query = f"EXECUTE {name} ({', '.join(['%s'] * len(params))})"
+        if name not in prepared:
+            cur.execute(f"PREPARE {name} AS {PREPARED_STATEMENTS[name]}")
+            prepared.add(name)
+            cur.execute(query, params)
+            return
+        idle = conn.get_transaction_status() == TRANSACTION_STATUS_IDLE
+        try:
+            cur.execute(query, params)
+        except psycopg2.Error as e:
+            if e.pgcode != _INVALID_STATEMENT_NAME:
+                raise
+            prepared.discard(name)
+            if not idle:
+                raise
+            conn.rollback()
+            cur.execute(f"PREPARE {name} AS {PREPARED_STATEMENTS[name]}")
+            prepared.add(name)
+            cur.execute(query, params)
+
+    def forget_prepared_statements(self, conn: connection | None = None):
+        """Esquece os statements preparados da conexão (padrão: a atual).
+
+        Chamado após SQL arbitrário na conexão, que pode ter executado
+        ``DEALLOCATE``/``DISCARD ALL``; o próximo uso prepara de novo.
+        """
+        self._prepared.pop(conn if conn is not None else self.conn, None)
+
     @contextmanager
     def transaction(self):
         """Contexto para controle de transações.
@@ -108,6 +277,26 @@ class DBManager:
             conn.rollback()
             raise
 
+    @contextmanager
+    def savepoint(self, name: str):
+        """Subtransação dentro de :meth:`transaction`.
+
+        Se o bloco falhar, desfaz apenas o que foi feito nele (``ROLLBACK TO
+        SAVEPOINT``) e propaga a exceção; o restante da transação externa
+        continua válido para o ``commit``.
+        """
+        ident = sql.Identifier(name)
+        with self.conn.cursor() as cur:
+            cur.execute(sql.SQL("SAVEPOINT {}").format(ident))
+        try:
+            yield
+        except Exception:
+            with self.conn.cursor() as cur:
+                cur.execute(sql.SQL("ROLLBACK TO SAVEPOINT {}").format(ident))
+            raise
+        with self.conn.cursor() as cur:
+            cur.execute(sql.SQL("RELEASE SAVEPOINT {}").format(ident))
+
     # ------------------------------------------------------------------
     def server_version_num(self) -> int:
         """Return PostgreSQL server version as integer (e.g. 150002)."""
@@ -121,12 +310,10 @@ class DBManager:
 
     def find_user_by_name(self, username: str) -> Optional[User]:
         self._reset_if_aborted()
-        with self.conn.cursor() as cur:
-            cur.execute("""
-                SELECT rolname, oid, rolvaliduntil, rolcanlogin
-                FROM pg_roles
-                WHERE rolname = %s
-            """, (username,))
+        conn = self.conn
+        with conn.cursor() as cur:
+            # Executada antes de criar/renovar/excluir cada usuário
+            self._execute_prepared(conn, cur, "find_user_by_name", (username,))
             row = cur.fetchone()
             if row:
                 return User(username=row[0], oid=row[1], valid_until=row[2], can_login=row[3])
@@ -136,16 +323,12 @@ class DBManager:
         with self.conn.cursor() as cur:
             if valid_until:
                 cur.execute(
-                    sql.SQL(
-                        "CREATE ROLE {} WITH LOGIN PASSWORD %s VALID UNTIL %s"
-                    ).format(sql.Identifier(username)),
+                    _SQL_CREATE_USER_UNTIL.format(sql.Identifier(username)),
                     (password_hash, valid_until),
                 )
             else:
                 cur.execute(
-                    sql.SQL("CREATE ROLE {} WITH LOGIN PASSWORD %s").format(
-                        sql.Identifier(username)
-                    ),
+                    _SQL_CREATE_USER.format(sql.Identifier(username)),
                     (password_hash,),
                 )
 
@@ -170,7 +353,7 @@ class DBManager:
 
     def delete_user(self, username: str):
         with self.conn.cursor() as cur:
-            cur.execute(sql.SQL("DROP ROLE {}").format(sql.Identifier(username)))
+            cur.execute(_SQL_DROP_ROLE.format(sql.Identifier(username)))
 
     def list_users(self) -> List[str]:
         self._reset_if_aborted()
@@ -186,7 +369,7 @@ class DBManager:
             # Anteriormente filtrava por padrões do permission_contract (filter_managed),
             # o que ocultava usuários gerados no formato primeiro.ultimo.
             # Agora retornamos todos os roles de login não-sistema.
-            return [row[0] for row in cur.fetchall()]
+            return list(map(_first_column, cur.fetchall()))
 
     # --- Contagens rápidas para dashboard ---
     def count_users(self) -> int:
@@ -238,11 +421,21 @@ class DBManager:
             )
             return cur.fetchone()[0]
 
+    def dashboard_counts(self, prefix: str = 'grp_') -> tuple:
+        """Retorna ``(usuários, grupos, schemas, tabelas)`` em uma única consulta.
+
+        Mesmos filtros de ``count_users``/``count_groups``/``count_schemas``/
+        ``count_tables``, mas com uma só ida ao servidor para o painel.
+        """
+        conn = self.conn
+        with conn.cursor() as cur:
+            # Reexecutada a cada atualização do painel: plano preparado uma vez
+            self._execute_prepared(conn, cur, "dashboard_counts", (f"{prefix}%",))
+            return tuple(cur.fetchone())
+
     def create_group(self, group_name: str):
         with self.conn.cursor() as cur:
-            cur.execute(
-                sql.SQL("CREATE ROLE {} NOLOGIN").format(sql.Identifier(group_name))
-            )
+            cur.execute(_SQL_CREATE_GROUP.format(sql.Identifier(group_name)))
 
     def delete_group(self, group_name: str):  # <-- NOVO MÉTODO ADICIONADO
         with self.conn.cursor() as cur:
@@ -286,7 +479,7 @@ class DBManager:
             for (member_name,) in cur.fetchall():
                 try:
                     cur.execute(
-                        sql.SQL("REVOKE {} FROM {}" ).format(
+                        _SQL_REVOKE_ROLE.format(
                             sql.Identifier(group_name), sql.Identifier(member_name)
                         )
                     )
@@ -299,12 +492,12 @@ class DBManager:
                     )
 
             # 4) Finalmente, excluir o role do grupo
-            cur.execute(sql.SQL("DROP ROLE {}" ).format(sql.Identifier(group_name)))
+            cur.execute(_SQL_DROP_ROLE.format(sql.Identifier(group_name)))
 
     def add_user_to_group(self, username: str, group_name: str):
         with self.conn.cursor() as cur:
             cur.execute(
-                sql.SQL("GRANT {} TO {}").format(
+                _SQL_GRANT_ROLE.format(
                     sql.Identifier(group_name),
                     sql.Identifier(username),
                 )
@@ -313,7 +506,7 @@ class DBManager:
     def remove_user_from_group(self, username: str, group_name: str):
         with self.conn.cursor() as cur:
             cur.execute(
-                sql.SQL("REVOKE {} FROM {}").format(
+                _SQL_REVOKE_ROLE.format(
                     sql.Identifier(group_name),
                     sql.Identifier(username),
                 )
@@ -321,30 +514,18 @@ class DBManager:
 
     def list_group_members(self, group_name: str) -> List[str]:
         self._reset_if_aborted()
-        with self.conn.cursor() as cur:
-            cur.execute("""
-                SELECT u.rolname
-                FROM pg_auth_members m
-                JOIN pg_roles u ON m.member = u.oid
-                JOIN pg_roles g ON m.roleid = g.oid
-                WHERE g.rolname = %s
-                ORDER BY u.rolname
-            """, (group_name,))
-            return [row[0] for row in cur.fetchall()]
+        conn = self.conn
+        with conn.cursor() as cur:
+            self._execute_prepared(conn, cur, "list_group_members", (group_name,))
+            return list(map(_first_column, cur.fetchall()))
 
     def list_user_groups(self, username: str) -> List[str]:
         self._reset_if_aborted()
-        with self.conn.cursor() as cur:
-            cur.execute("""
-                SELECT g.rolname
-                FROM pg_auth_members m
-                JOIN pg_roles u ON m.member = u.oid
-                JOIN pg_roles g ON m.roleid = g.oid
-                WHERE u.rolname = %s
-                ORDER BY g.rolname
-            """, (username,))
+        conn = self.conn
+        with conn.cursor() as cur:
+            self._execute_prepared(conn, cur, "list_user_groups", (username,))
             # Removido filter_managed para exibir todos os grupos atribuídos
-            return [row[0] for row in cur.fetchall()]
+            return list(map(_first_column, cur.fetchall()))
 
     def list_groups(self) -> List[str]:
         self._reset_if_aborted()
@@ -358,7 +539,7 @@ class DBManager:
                 ORDER BY rolname
             """)
             # Removido filter_managed para permitir visualizar todos os grupos
-            return [row[0] for row in cur.fetchall()]
+            return list(map(_first_column, cur.fetchall()))
 
     def list_roles(self) -> List[str]:
         """Retorna todos os roles disponíveis (usuários e grupos)."""
@@ -372,7 +553,7 @@ class DBManager:
                 ORDER BY rolname
                 """
             )
-            return filter_managed([row[0] for row in cur.fetchall()])
+            return filter_managed(list(map(_first_column, cur.fetchall())))
 
     def list_all_roles(self, include_internal: bool = False) -> List[str]:
         """Lista todos os roles (logins e grupos) opcionando exclusão dos internos.
@@ -396,7 +577,7 @@ class DBManager:
                     ORDER BY rolname
                     """
                 )
-            return [row[0] for row in cur.fetchall()]
+            return list(map(_first_column, cur.fetchall()))
 
     # Métodos de tabelas e privilégios ------------------------------------
 
@@ -417,29 +598,37 @@ class DBManager:
                 ``None``.
         """
 
-        # Determine schemas to include
+        # Parte de pg_namespace com LEFT JOIN em pg_class: uma única consulta
+        # traz também os schemas vazios (antes exigia list_schemas() à parte)
         if include_schemas is not None:
-            schemas = include_schemas
+            schema_filter = "n.nspname = ANY(%s)"
+            params: list[object] = [list(include_types), list(include_schemas)]
+            result: Dict[str, List[str]] = {schema: [] for schema in include_schemas}
         else:
-            schemas = [s for s in self.list_schemas() if s not in exclude_schemas]
+            schema_filter = (
+                "n.nspname NOT IN ('pg_catalog', 'information_schema', 'pg_toast')"
+                " AND n.nspname <> ALL(%s)"
+            )
+            params = [list(include_types), list(exclude_schemas)]
+            result = {}
 
         query = [
             "SELECT n.nspname, c.relname",
-            "FROM pg_catalog.pg_class c",
-            "JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace",
-            "WHERE c.relkind = ANY(%s)",
-            "AND n.nspname = ANY(%s)",
+            "FROM pg_catalog.pg_namespace n",
+            "LEFT JOIN pg_catalog.pg_class c",
+            "  ON c.relnamespace = n.oid AND c.relkind = ANY(%s)",
+            f"WHERE {schema_filter}",
             "ORDER BY n.nspname, c.relname",
         ]
         sql_query = "\n".join(query)
-        params: list[object] = [list(include_types), schemas]
 
         self._reset_if_aborted()
         with self.conn.cursor() as cur:
             cur.execute(sql_query, params)
-            result: Dict[str, List[str]] = {schema: [] for schema in schemas}
             for schema, table in cur.fetchall():
-                result.setdefault(schema, []).append(table)
+                tables = result.setdefault(schema, [])
+                if table is not None:
+                    tables.append(table)
             return result
 
     def get_group_privileges(self, group: str) -> Dict[str, Dict[str, Set[str]]]:
@@ -482,7 +671,7 @@ class DBManager:
                 cur.execute(query, (group,))
                 result: Dict[str, Dict[str, Set[str]]] = {}
                 for schema, table, priv, grantable in cur.fetchall():
-                    privname = priv + ("*" if grantable else "")
+                    privname = priv_label(priv, grantable)
                     result.setdefault(schema, {}).setdefault(table, set()).add(privname)
                 return result
         except Exception as e:
@@ -491,12 +680,63 @@ class DBManager:
             self._reset_if_aborted()
             return {}
 
+    def get_group_privileges_bulk(
+        self, groups: List[str]
+    ) -> Dict[str, Dict[str, Dict[str, Set[str]]]]:
+        """Versão em lote de :meth:`get_group_privileges`.
+
+        Executa uma única consulta com ``rolname = ANY(%s)`` e retorna
+        ``{grupo: {schema: {tabela: {privs}}}}``. Grupos sem privilégios
+        aparecem com dicionário vazio.
+        """
+        result: Dict[str, Dict[str, Dict[str, Set[str]]]] = {g: {} for g in groups}
+        if not groups:
+            return result
+        query = (
+            """
+            SELECT
+                gr.rolname AS grantee,
+                n.nspname AS table_schema,
+                c.relname AS table_name,
+                a.privilege_type,
+                a.is_grantable
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            CROSS JOIN LATERAL aclexplode(
+                COALESCE(
+                    c.relacl,
+                    acldefault(
+                        (CASE WHEN c.relkind = 'S' THEN 'S'::"char" ELSE 'r'::"char" END),
+                        c.relowner
+                    )
+                )
+            ) AS a
+            JOIN pg_roles gr ON gr.oid = a.grantee
+            WHERE gr.rolname = ANY(%s)
+            """
+        )
+        self._reset_if_aborted()
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(query, (list(groups),))
+                for grantee, schema, table, priv, grantable in cur.fetchall():
+                    privname = priv_label(priv, grantable)
+                    result[grantee].setdefault(schema, {}).setdefault(table, set()).add(
+                        privname
+                    )
+                return result
+        except psycopg2.Error as e:
+            logger.error("Erro ao obter privilégios dos grupos %s: %s", groups, e)
+            self._reset_if_aborted()
+            return {g: {} for g in groups}
+
     def apply_group_privileges(
         self,
         group: str,
         privileges: Dict[str, Dict[str, Set[str]]],
         obj_type: str = "TABLE",
         check_dependencies: bool = True,
+        current: Optional[Dict[str, Dict[str, Set[str]]]] = None,
     ):
         """Aplica GRANT/REVOKE para tabelas ou sequências.
 
@@ -508,6 +748,9 @@ class DBManager:
             Estrutura ``{schema: {obj: {priv1, priv2}}}``.
         obj_type : str, optional
             ``"TABLE"`` (padrão) ou ``"SEQUENCE"``.
+        current : Dict[str, Dict[str, Set[str]]], optional
+            Privilégios atuais do grupo já lidos pelo chamador (ex.: via
+            ``get_group_privileges_bulk``); evita reler o catálogo.
         """
 
         obj_type = obj_type.upper()
@@ -517,51 +760,54 @@ class DBManager:
         keyword = sql.SQL(obj_type)
 
         # Obtém os privilégios atuais para comparar com os desejados
-        current = self.get_group_privileges(group)
-
-        with self.conn.cursor() as cur:
-            for schema, objects in privileges.items():
-                for name, perms in objects.items():
-                    desired = set(perms)
-                    invalid = desired - allowed
-                    if invalid:
-                        raise ValueError(
-                            f"Privilégios inválidos para {obj_type}: {', '.join(sorted(invalid))}"
-                        )
+        if current is None:
+            current = self.get_group_privileges(group)
+
+        # Acumula REVOKE/GRANT de todos os objetos e envia em uma única ida
+        # ao servidor (mesma transação; nada é enviado se a validação falhar)
+        statements = []
+        for schema, objects in privileges.items():
+            for name, perms in objects.items():
+                desired = set(perms)
+                invalid = desired - allowed
+                if invalid:
+                    raise ValueError(
+                        f"Privilégios inválidos para {obj_type}: {', '.join(sorted(invalid))}"
+                    )
 
-                    identifier = sql.Identifier(schema, name)
-                    existing = current.get(schema, {}).get(name, set())
-                    to_grant = desired - existing
-                    to_revoke = existing - desired
-
-                    if to_revoke:
-                        if check_dependencies:
-                            deps = self.get_object_dependencies(schema, name)
-                            if deps:
-                                raise RuntimeError(
-                                    f"[WARN-DEPEND] {schema}.{name} possui dependências: {deps}"
-                                )
-                        cur.execute(
-                            sql.SQL("REVOKE {} ON {} {} FROM {}").format(
-                                sql.SQL(", ").join(
-                                    sql.SQL(p.rstrip("*")) for p in sorted(to_revoke)
-                                ),
-                                keyword,
-                                identifier,
-                                sql.Identifier(group),
+                identifier = sql.Identifier(schema, name)
+                existing = current.get(schema, {}).get(name, set())
+                to_grant = desired - existing
+                to_revoke = existing - desired
+
+                if to_revoke:
+                    if check_dependencies:
+                        deps = self.get_object_dependencies(schema, name)
+                        if deps:
+                            raise RuntimeError(
+                                f"[WARN-DEPEND] {schema}.{name} possui dependências: {deps}"
                             )
+                    statements.append(
+                        _SQL_REVOKE_ON.format(
+                            _privilege_list(frozenset(to_revoke)),
+                            keyword,
+                            identifier,
+                            sql.Identifier(group),
                         )
-                    if to_grant:
-                        cur.execute(
-                            sql.SQL("GRANT {} ON {} {} TO {}").format(
-                                sql.SQL(", ").join(
-                                    sql.SQL(p.rstrip("*")) for p in sorted(to_grant)
-                                ),
-                                keyword,
-                                identifier,
-                                sql.Identifier(group),
-                            )
+                    )
+                if to_grant:
+                    statements.append(
+                        _SQL_GRANT_ON.format(
+                            _privilege_list(frozenset(to_grant)),
+                            keyword,
+                            identifier,
+                            sql.Identifier(group),
                         )
+                    )
+
+        if statements:
+            with self.conn.cursor() as cur:
+                cur.execute(_SQL_STATEMENT_SEP.join(statements))
 
     def grant_database_privileges(self, group: str, privileges: Set[str]):
         """Concede privilégios de banco ao grupo especificado.
@@ -579,7 +825,7 @@ class DBManager:
                 f"Privilégios inválidos para DATABASE: {', '.join(sorted(invalid))}"
             )
 
-        dbname = self.conn.get_dsn_parameters().get("dbname")
+        dbname = self.dbname
         with self.conn.cursor() as cur:
             cur.execute(
                 """
@@ -595,8 +841,7 @@ class DBManager:
                 (group,),
             )
             current = {
-                priv + ("*" if grantable else "")
-                for priv, grantable in cur.fetchall()
+                priv_label(priv, grantable) for priv, grantable in cur.fetchall()
             }
 
             managed_current = {
@@ -605,21 +850,22 @@ class DBManager:
             to_grant = privileges - managed_current
             to_revoke = managed_current - privileges
 
+            # REVOKE e GRANTs vão juntos em uma única ida ao servidor
+            statements = []
             if to_revoke:
-                revoke_sql = sql.SQL("REVOKE {} ON DATABASE {} FROM {}").format(
-                    sql.SQL(", ").join(
-                        sql.SQL(p.rstrip("*")) for p in sorted(to_revoke)
-                    ),
-                    sql.Identifier(dbname),
-                    sql.Identifier(group),
+                statements.append(
+                    sql.SQL("REVOKE {} ON DATABASE {} FROM {}").format(
+                        _privilege_list(frozenset(to_revoke)),
+                        sql.Identifier(dbname),
+                        sql.Identifier(group),
+                    )
                 )
-                cur.execute(revoke_sql)
 
             if to_grant:
                 plain = [p.rstrip("*") for p in sorted(to_grant) if not p.endswith("*")]
                 star = [p.rstrip("*") for p in sorted(to_grant) if p.endswith("*")]
                 if plain:
-                    cur.execute(
+                    statements.append(
                         sql.SQL("GRANT {} ON DATABASE {} TO {}").format(
                             sql.SQL(", ").join(sql.SQL(p) for p in plain),
                             sql.Identifier(dbname),
@@ -627,7 +873,7 @@ class DBManager:
                         )
                     )
                 if star:
-                    cur.execute(
+                    statements.append(
                         sql.SQL(
                             "GRANT {} ON DATABASE {} TO {} WITH GRANT OPTION"
                         ).format(
@@ -637,13 +883,16 @@ class DBManager:
                         )
                     )
 
+            if statements:
+                cur.execute(_SQL_STATEMENT_SEP.join(statements))
+
     def grant_schema_privileges(self, group: str, schema: str, privileges: Set[str]):
         """Concede privilégios de schema ao grupo informado."""
         # Sanitiza marcador de 'sujo' caso tenha escapado da camada GUI
         if schema.endswith(" *"):
             logger.debug("[grant_schema_privileges] Stripping dirty marker from schema '%s'", schema)
             schema = schema[:-2]
-        logger.debug(f"grant_schema_privileges called: group={group}, schema={schema}, privileges={privileges}")
+        logger.debug("grant_schema_privileges called: group=%s, schema=%s, privileges=%s", group, schema, privileges)
         
         base_privs = {p.rstrip("*") for p in privileges}
         invalid = base_privs - PRIVILEGE_WHITELIST["SCHEMA"]
@@ -668,7 +917,7 @@ class DBManager:
                 (group, schema),
             )
             current = {
-                priv + ("*" if grantable else "") for priv, grantable in cur.fetchall()
+                priv_label(priv, grantable) for priv, grantable in cur.fetchall()
             }
             logger.debug(
                 "Existing schema privileges for %s on %s: %s", group, schema, current
@@ -681,50 +930,43 @@ class DBManager:
             to_grant = privileges - managed_current
             to_revoke = managed_current - privileges
 
+            # REVOKE e GRANTs vão juntos em uma única ida ao servidor
+            statements = []
             if to_revoke:
-                revoke_sql = sql.SQL("REVOKE {} ON SCHEMA {} FROM {}").format(
-                    sql.SQL(", ").join(
-                        sql.SQL(p.rstrip("*")) for p in sorted(to_revoke)
-                    ),
-                    identifier,
-                    sql.Identifier(group),
+                statements.append(
+                    sql.SQL("REVOKE {} ON SCHEMA {} FROM {}").format(
+                        _privilege_list(frozenset(to_revoke)),
+                        identifier,
+                        sql.Identifier(group),
+                    )
                 )
-                try:
-                    debug_sql = revoke_sql.as_string(cur)
-                except Exception:
-                    debug_sql = str(revoke_sql)
-                logger.debug(f"Executing REVOKE: {debug_sql}")
-                cur.execute(revoke_sql)
 
             if to_grant:
                 plain = [p.rstrip("*") for p in sorted(to_grant) if not p.endswith("*")]
                 star = [p.rstrip("*") for p in sorted(to_grant) if p.endswith("*")]
                 if plain:
-                    grant_sql = sql.SQL("GRANT {} ON SCHEMA {} TO {}").format(
-                        sql.SQL(", ").join(sql.SQL(p) for p in plain),
-                        identifier,
-                        sql.Identifier(group),
+                    statements.append(
+                        sql.SQL("GRANT {} ON SCHEMA {} TO {}").format(
+                            sql.SQL(", ").join(sql.SQL(p) for p in plain),
+                            identifier,
+                            sql.Identifier(group),
+                        )
                     )
-                    try:
-                        debug_sql = grant_sql.as_string(cur)
-                    except Exception:
-                        debug_sql = str(grant_sql)
-                    logger.debug(f"Executing GRANT: {debug_sql}")
-                    cur.execute(grant_sql)
                 if star:
-                    grant_sql = sql.SQL(
-                        "GRANT {} ON SCHEMA {} TO {} WITH GRANT OPTION"
-                    ).format(
-                        sql.SQL(", ").join(sql.SQL(p) for p in star),
-                        identifier,
-                        sql.Identifier(group),
+                    statements.append(
+                        sql.SQL(
+                            "GRANT {} ON SCHEMA {} TO {} WITH GRANT OPTION"
+                        ).format(
+                            sql.SQL(", ").join(sql.SQL(p) for p in star),
+                            identifier,
+                            sql.Identifier(group),
+                        )
                     )
-                    try:
-                        debug_sql = grant_sql.as_string(cur)
-                    except Exception:
-                        debug_sql = str(grant_sql)
-                    logger.debug(f"Executing GRANT (WGO): {debug_sql}")
-                    cur.execute(grant_sql)
+
+            if statements:
+                batch = _SQL_STATEMENT_SEP.join(statements)
+                _debug_sql("Executing", batch, cur)
+                cur.execute(batch)
 
             if to_grant or to_revoke:
                 logger.info(
@@ -756,7 +998,7 @@ class DBManager:
         
         try:
             with self.conn.cursor() as cur:
-                logger.debug(f"=== get_schema_privileges START for role: '{role}' ===")
+                logger.debug("=== get_schema_privileges START for role: '%s' ===", role)
                 
                 # Lista todos os schemas primeiro
                 cur.execute(
@@ -774,7 +1016,7 @@ class DBManager:
                             schemas.append(row[0])
                     except Exception:
                         continue
-                logger.debug(f"Found schemas: {schemas}")
+                logger.debug("Found schemas: %s", schemas)
                 
                 # Para cada schema, verifica privilégios individualmente
                 for schema in schemas:
@@ -796,18 +1038,18 @@ class DBManager:
                             
                         if privs:
                             out[schema] = privs
-                            logger.debug(f"Schema '{schema}': {privs} for role '{role}'")
+                            logger.debug("Schema '%s': %s for role '%s'", schema, privs, role)
                             
                     except Exception as e:
-                        logger.debug(f"Error checking privileges for schema '{schema}': {e}")
+                        logger.debug("Error checking privileges for schema '%s': %s", schema, e)
                         continue
                         
         except Exception as e:
-            logger.warning(f"Erro ao consultar privilégios de schema para role '{role}': {e}")
+            logger.warning("Erro ao consultar privilégios de schema para role '%s': %s", role, e)
             # Retorna vazio em caso de erro, mas nunca quebra
             return {}
             
-        logger.debug(f"=== get_schema_privileges END: {out} ===")
+        logger.debug("=== get_schema_privileges END: %s ===", out)
         return out
 
     def get_default_privileges(
@@ -815,7 +1057,7 @@ class DBManager:
         owner: str | None = None,
         objtype: str = "r",
         schema: str | None = None,
-    ) -> Dict[str, Dict[str, Set[str]]]:
+    ) -> Dict[str, Dict[str, FrozenSet[str]]]:
         """Return default privileges for future objects.
 
         Parameters
@@ -829,6 +1071,9 @@ class DBManager:
         schema: str | None
             Filter by schema name (``defaclnamespace``) when ``IN SCHEMA`` is
             used. If ``None`` return defaults for all schemas.
+
+        Os conjuntos de privilégios são devolvidos como ``frozenset`` para que
+        possam ser comparados e usados como chave sem cópias.
         """
 
         params: Dict[str, object] = {"objtype": objtype}
@@ -864,19 +1109,23 @@ class DBManager:
             with self.conn.cursor() as cur:
                 cur.execute(sql_query, params)
                 rows = cur.fetchall()
-
-            for owner_role, schema_name, grantee, priv, grantable in rows:
-                meta_owner[schema_name] = owner_role
-                privname = priv + ("*" if grantable else "")
-                result.setdefault(schema_name, {}).setdefault(grantee, set()).add(
-                    privname
-                )
-        except Exception as e:
+        except psycopg2.Error as e:
             logger.warning("Erro ao consultar default privileges: %s", e)
             return {}
 
-        result["_meta"] = {"owner_roles": meta_owner}
-        return result
+        for owner_role, schema_name, grantee, priv, grantable in rows:
+            meta_owner[schema_name] = owner_role
+            privname = priv_label(priv, grantable)
+            result.setdefault(schema_name, {}).setdefault(grantee, set()).add(
+                privname
+            )
+
+        frozen: Dict[str, object] = {
+            schema_name: {g: frozenset(p) for g, p in grants.items()}
+            for schema_name, grants in result.items()
+        }
+        frozen["_meta"] = {"owner_roles": meta_owner}
+        return frozen
 
     def get_object_dependencies(self, schema: str, objname: str) -> List[tuple[str, str]]:
         """Return list of dependent objects for a given table/view.
@@ -922,7 +1171,7 @@ class DBManager:
 
     def get_default_table_privileges(self, role: str) -> Dict[str, Set[str]]:
         """Retorna os privilégios padrão para tabelas futuramente criadas em cada schema."""
-        logger.debug(f"=== get_default_table_privileges START for role: '{role}' ===")
+        logger.debug("=== get_default_table_privileges START for role: '%s' ===", role)
     
         out = {}
         try:
@@ -946,7 +1195,7 @@ class DBManager:
                         n.nspname
                 """
                 
-                logger.debug(f"Executando query: {query} com parâmetro: {role}")
+                logger.debug("Executando query: %s com parâmetro: %s", query, role)
                 cur.execute(query, (role,))
                 
                 for schema, priv in cur.fetchall():
@@ -954,23 +1203,23 @@ class DBManager:
                         if schema not in out:
                             out[schema] = set()
                         out[schema].add(priv)
-                        logger.debug(f"✓ Found default privilege: {schema}.{priv} for {role}")
+                        logger.debug("✓ Found default privilege: %s.%s for %s", schema, priv, role)
     
         except Exception as e:
-            logger.exception(f"Erro ao consultar privilégios default para role '{role}'")
+            logger.exception("Erro ao consultar privilégios default para role '%s'", role)
     
-        logger.debug(f"=== get_default_table_privileges END: {out} ===")
+        logger.debug("=== get_default_table_privileges END: %s ===", out)
         return out
 
     def alter_default_privileges(
         self, group: str, schema: str, obj_type: str, privileges: Set[str], for_role: str = None
     ):
         """Altera os privilégios padrão para objetos futuros em um schema."""
-        logger.debug(f"=== alter_default_privileges START ===")
+        logger.debug("=== alter_default_privileges START ===")
         if schema.endswith(" *"):
             logger.debug("[alter_default_privileges] Stripping dirty marker from schema '%s'", schema)
             schema = schema[:-2]
-        logger.debug(f"group={group}, schema={schema}, obj_type={obj_type}, privileges={privileges}, for_role={for_role}")
+        logger.debug("group=%s, schema=%s, obj_type=%s, privileges=%s, for_role=%s", group, schema, obj_type, privileges, for_role)
 
         # Validações
         if obj_type not in OBJECT_TYPES:
@@ -989,7 +1238,7 @@ class DBManager:
         desired = set(privileges)
         grant_set = desired - existing
         revoke_set = existing - desired
-        logger.debug(f"existing={existing}, desired={desired}, grant_set={grant_set}, revoke_set={revoke_set}")
+        logger.debug("existing=%s, desired=%s, grant_set=%s, revoke_set=%s", existing, desired, grant_set, revoke_set)
         if not grant_set and not revoke_set:
             logger.debug("Default privileges already set; no-op.")
             return True
@@ -1012,11 +1261,7 @@ class DBManager:
                     group=sql.Identifier(group),
                 )
 
-                try:
-                    sql_text = revoke_sql.as_string(cur)
-                except Exception:
-                    sql_text = str(revoke_sql)
-                logger.debug(f"Executing REVOKE: {sql_text}")
+                _debug_sql("Executing REVOKE", revoke_sql, cur)
                 cur.execute(revoke_sql)
 
             if grant_set:
@@ -1030,11 +1275,7 @@ class DBManager:
                     group=sql.Identifier(group),
                 )
 
-                try:
-                    sql_text = grant_sql.as_string(cur)
-                except Exception:
-                    sql_text = str(grant_sql)
-                logger.debug(f"Executing GRANT: {sql_text}")
+                _debug_sql("Executing GRANT", grant_sql, cur)
                 cur.execute(grant_sql)
 
         if grant_set or revoke_set:
@@ -1042,9 +1283,81 @@ class DBManager:
             logger.info(
                 f"\u2713 Applied default privileges: grant {grant_set} revoke {revoke_set} for {obj_type} in {schema} to {group}"
             )
-        logger.debug(f"=== alter_default_privileges END ===")
+        logger.debug("=== alter_default_privileges END ===")
         return True
 
+    def alter_default_privileges_bulk(
+        self,
+        entries: List[tuple],
+        for_role: str | None = None,
+    ) -> int:
+        """Aplica vários ``ALTER DEFAULT PRIVILEGES`` em um único ``execute``.
+
+        ``entries`` é uma lista de ``(grupo, schema, obj_type, privilégios)``.
+        O estado atual é lido uma vez por tipo de objeto (e não por schema) e
+        apenas os comandos necessários são enviados, concatenados em um único
+        comando. Não efetua ``commit``: o chamador deve usar
+        :meth:`transaction`. Retorna o número de comandos executados.
+        """
+        if for_role:
+            for_role_sql = sql.SQL("FOR ROLE {}").format(sql.Identifier(for_role))
+        else:
+            for_role_sql = sql.SQL("")
+
+        current_by_code: Dict[str, Dict[str, object]] = {}
+        statements: List[sql.Composable] = []
+        for group, schema, obj_type, privileges in entries:
+            if schema.endswith(" *"):
+                schema = schema[:-2]
+            if obj_type not in OBJECT_TYPES:
+                raise ValueError(f"Tipo de objeto inválido: {obj_type}")
+            code = OBJECT_TYPE_CODES[obj_type]
+            if code not in current_by_code:
+                current_by_code[code] = self.get_default_privileges(
+                    owner=for_role, objtype=code
+                )
+            existing = current_by_code[code].get(schema, {}).get(group, frozenset())
+            desired = set(privileges)
+            common = {
+                "for_role": for_role_sql,
+                "schema": sql.Identifier(schema),
+                "obj_type": sql.SQL(OBJECT_TYPE_MAPS[obj_type]),
+                "group": sql.Identifier(group),
+            }
+            revoke_set = existing - desired
+            if revoke_set:
+                statements.append(
+                    sql.SQL(
+                        "ALTER DEFAULT PRIVILEGES {for_role} IN SCHEMA {schema} REVOKE {privs} ON {obj_type} FROM {group}"
+                    ).format(
+                        privs=sql.SQL(", ").join(sql.SQL(p) for p in sorted(revoke_set)),
+                        **common,
+                    )
+                )
+            grant_set = desired - existing
+            if grant_set:
+                statements.append(
+                    sql.SQL(
+                        "ALTER DEFAULT PRIVILEGES {for_role} IN SCHEMA {schema} GRANT {privs} ON {obj_type} TO {group}"
+                    ).format(
+                        privs=sql.SQL(", ").join(sql.SQL(p) for p in sorted(grant_set)),
+                        **common,
+                    )
+                )
+
+        if not statements:
+            logger.debug("[alter_default_privileges_bulk] Nada a alterar; no-op.")
+            return 0
+
+        with self.conn.cursor() as cur:
+            cur.execute(_SQL_STATEMENT_SEP.join(statements))
+        logger.info(
+            "\u2713 Applied %d default privilege statements (FOR ROLE %s)",
+            len(statements),
+            for_role,
+        )
+        return len(statements)
+
     # Métodos de schema
     def create_schema(self, schema_name: str, owner: str | None = None):
         with self.conn.cursor() as cur:
@@ -1100,7 +1413,7 @@ class DBManager:
                 ORDER BY nspname
                 """
             )
-            return [row[0] for row in cur.fetchall()]
+            return list(map(_first_column, cur.fetchall()))
 
     def enable_postgis(self, schema_name: str):
         """Garante que a extensão PostGIS esteja disponível no schema informado.
@@ -44,7 +44,7 @@ class _TaskRunner(QThread):
             self.failed.emit(e)
 
 
-@dataclass
+@dataclass(slots=True)
 class PrivilegesState:
     schema_privs: set[str] = field(default_factory=set)
     table_privs: dict[str, set[str]] = field(default_factory=dict)
@@ -68,6 +68,16 @@ class ConnectThread(QThread):
             self.failed.emit(e)
 
 
+def connect_controller_caches(users_controller, groups_controller):
+    """Liga as invalidações de cache cruzadas entre users e groups."""
+    # Mudanças de pertencimento alteram default privileges dos grupos
+    users_controller.members_changed.connect(
+        lambda _group: groups_controller.invalidate_cache()
+    )
+    # Excluir grupo com membros remove usuários (delete_group_and_members)
+    groups_controller.data_changed.connect(users_controller.invalidate_cache)
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -396,7 +406,12 @@ class MainWindow(QMainWindow):
                 operador=params['user']
             )
             self.users_controller = UsersController(self.role_manager)
-            self.groups_controller = GroupsController(self.role_manager)
+            # Sweeps em segundo plano abrem conexão própria (não compartilham ui_conn)
+            self.groups_controller = GroupsController(
+                self.role_manager,
+                connection_factory=lambda: cm.open_dedicated(**safe_params),
+            )
+            connect_controller_caches(self.users_controller, self.groups_controller)
 
             self.schema_manager = SchemaManager(
                 self.db_manager, self.logger,
@@ -615,7 +630,18 @@ class MainWindow(QMainWindow):
         if not self.db_manager:
             raise RuntimeError('Não conectado')
         from .sql_console_view import SQLConsoleView
-        return SQLConsoleView(self.db_manager, self)
+        v = SQLConsoleView(self.db_manager, self)
+        v.executed.connect(self._on_console_executed)
+        return v
+
+    def _on_console_executed(self):
+        """O console roda SQL arbitrário (DDL, GRANT): descarta leituras em cache."""
+        if self.groups_controller:
+            self.groups_controller.invalidate_cache()
+        if self.users_controller:
+            self.users_controller.invalidate_cache()
+        if self.schema_controller:
+            self.schema_controller.invalidate_cache()
 
     # --- Tab helpers ---
     def open_panel(self, key: str):
@@ -685,11 +711,13 @@ class MainWindow(QMainWindow):
                     db = p.get('dbname')
                     user = p.get('user')
                     host = p.get('host')
-                # simple ping
+                # simple ping (conexão já fechada dispensa a ida ao servidor)
                 try:
-                    with self.db_manager.conn.cursor() as cur:
-                        cur.execute('SELECT 1')
-                    connected = True
+                    conn = self.db_manager.conn
+                    if not conn.closed:
+                        with conn.cursor() as cur:
+                            cur.execute('SELECT 1')
+                        connected = True
                 except Exception:
                     connected = False
                 self.dashboard.set_connection_info(db, user, host, connected)
@@ -705,10 +733,7 @@ class MainWindow(QMainWindow):
                 return
             from ..config_manager import load_config
             prefix = load_config().get('group_prefix', 'grp_')
-            u = self.db_manager.count_users()
-            g = self.db_manager.count_groups(prefix=prefix)
-            s = self.db_manager.count_schemas()
-            t = self.db_manager.count_tables()
+            u, g, s, t = self.db_manager.dashboard_counts(prefix=prefix)
             self.dashboard.set_counts(u, g, s, t)
         except Exception:
             self.dashboard.set_counts(None, None, None, None)
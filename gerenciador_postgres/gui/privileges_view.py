@@ -493,26 +493,43 @@ class PrivilegesView(QWidget):
         progress.setWindowModality(Qt.WindowModality.ApplicationModal)
         progress.setCancelButton(None)
         progress.show()
-        QApplication.processEvents()
-        try:
-            ok = self.controller.sweep_group_privileges(role)
+        self.btnSweep.setEnabled(False)
+
+        def on_finished(group_name: str, ok: bool, error: str):
+            if group_name != role:
+                return
+            self.controller.sweep_finished.disconnect(on_finished)
+            progress.close()
+            self.btnSweep.setEnabled(True)
             if ok:
                 QMessageBox.information(
                     self,
                     "Concluído",
                     f"Privilégios de '{role}' sincronizados.",
                 )
+            elif error:
+                QMessageBox.critical(
+                    self,
+                    "Erro",
+                    f"Não foi possível sincronizar privilégios: {error}",
+                )
             else:
                 QMessageBox.critical(
                     self,
                     "Erro",
                     f"Falha ao sincronizar privilégios de '{role}'.",
                 )
+
+        self.controller.sweep_finished.connect(on_finished)
+        try:
+            # O sweep roda no QThreadPool; a interface continua responsiva
+            self.controller.sweep_group_privileges_async(role)
         except Exception as e:
+            self.controller.sweep_finished.disconnect(on_finished)
+            progress.close()
+            self.btnSweep.setEnabled(True)
             QMessageBox.critical(
                 self,
                 "Erro",
                 f"Não foi possível sincronizar privilégios: {e}",
             )
-        finally:
-            progress.close()
@@ -3,7 +3,7 @@ from pathlib import Path
 import json
 
 import psycopg2
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QIcon, QFont, QKeySequence, QShortcut
 from PyQt6.QtWidgets import (
     QWidget,
@@ -28,6 +28,10 @@ from .sql_syntax_highlighter import SQLSyntaxHighlighter
 class SQLConsoleView(QWidget):
     """Janela simples para executar comandos SQL."""
 
+    # Emitido após uma execução confirmada (commit); o SQL pode ter alterado
+    # roles, grants ou schemas lidos em cache pelos controllers
+    executed = pyqtSignal()
+
     def __init__(self, db_manager: DBManager, parent: QWidget | None = None):
         super().__init__(parent)
         assets_dir = Path(__file__).resolve().parents[2] / "assets"
@@ -246,6 +250,9 @@ class SQLConsoleView(QWidget):
                 except Exception:
                     pass
 
+        # DEALLOCATE/DISCARD ALL valem para a sessão mesmo após rollback
+        self.db_manager.forget_prepared_statements(conn)
+
         elapsed = perf_counter() - start_time
         if not had_error:
             try:
@@ -254,6 +261,7 @@ class SQLConsoleView(QWidget):
                 pass
             self.append_message("[OK] Execução concluída.")
             self.status_bar.showMessage(f"Concluído em {elapsed:.2f}s | Linhas afetadas: {last_row_count}")
+            self.executed.emit()
         else:
             self.status_bar.showMessage(f"Erro após {elapsed:.2f}s (transação revertida)")
 
@@ -4,6 +4,9 @@ from pathlib import Path
 from .path_config import BASE_DIR
 from .config_manager import load_config
 
+# Handlers criados por setup_logger (fechados ao reconfigurar)
+_own_handlers: list[logging.Handler] = []
+
 
 def setup_logger():
     """Configure o logger raiz para arquivo e console.
@@ -40,6 +43,10 @@ def setup_logger():
     stream_handler.setFormatter(formatter)
 
     logger.handlers.clear()
+    # Libera o arquivo de log aberto por uma configuração anterior
+    for handler in _own_handlers:
+        handler.close()
+    _own_handlers[:] = [file_handler, stream_handler]
     logger.addHandler(file_handler)
     logger.addHandler(stream_handler)
 
@@ -58,6 +65,15 @@ def setup_logger():
     return logger
 
 
+def ensure_logger():
+    """Configura o logger raiz apenas se ainda não foi configurado.
+
+    Chamado a cada nova conexão; evita reler ``config.yml`` e reabrir o
+    arquivo de log quando a configuração já está ativa.
+    """
+    if not _own_handlers:
+        setup_logger()
+
+
 # Configure default logger on module import if not already configured
-if not logging.getLogger('app').handlers:
-    setup_logger()
+ensure_logger()
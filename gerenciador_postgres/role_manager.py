@@ -106,6 +106,23 @@ class RoleManager:
                 )
                 raise
 
+        # Nomes de roles existentes carregados uma única vez: a geração de
+        # usernames testa vários candidatos por aluno sem ir ao banco
+        try:
+            existing_roles: Set[str] | None = set(
+                self.dao.list_all_roles(include_internal=True)
+            )
+        except Exception as e:
+            self.logger.debug(
+                f"[{self.operador}] Sem lista prévia de roles, consultando por candidato: {e}"
+            )
+            existing_roles = None
+
+        def role_exists(name: str) -> bool:
+            if existing_roles is None:
+                return bool(self.dao.find_user_by_name(name))
+            return name in existing_roles
+
         created: List[str] = []
         for matricula, nome_completo in users_info:
             password = matricula
@@ -128,8 +145,7 @@ class RoleManager:
                 username = self._sanitize_username(candidate)
                 # Checagem prévia para evitar exceção de duplicidade e acelerar a próxima tentativa
                 try:
-                    user_exists = self.dao.find_user_by_name(username)
-                    if user_exists:
+                    if role_exists(username):
                         if renew:
                             success = self.update_user(username, valid_until=valid_until)
                             created_username = username if success else None
@@ -149,6 +165,8 @@ class RoleManager:
                 except Exception as e:
                     created_username, error = None, e
                 if created_username:
+                    if existing_roles is not None:
+                        existing_roles.add(created_username)
                     if group_name:
                         self.add_user_to_group(created_username, group_name)
                     created.append(created_username)
@@ -361,12 +379,13 @@ class RoleManager:
                 try:
                     # Para tabelas, usar SELECT como mínimo; aplicar em todos os schemas existentes
                     min_table_perms = {"SELECT"}
-                    for schema in self.dao.list_schemas():
-                        self.dao.alter_default_privileges(
-                            group_name,
-                            schema=schema,
-                            obj_type="tables",
-                            privileges=min_table_perms,
+                    # Savepoint: uma falha aqui não pode abortar o GRANT de pertencimento
+                    with self.dao.savepoint("membership_defaults"):
+                        self.dao.alter_default_privileges_bulk(
+                            [
+                                (group_name, schema, "tables", min_table_perms)
+                                for schema in self.dao.list_schemas()
+                            ],
                             for_role=username,
                         )
                 except Exception as e:
@@ -386,12 +405,13 @@ class RoleManager:
                 self.dao.remove_user_from_group(username, group_name)
                 # Revoga defaults FOR ROLE para que novas criações de 'username' não concedam mais ao grupo
                 try:
-                    for schema in self.dao.list_schemas():
-                        self.dao.alter_default_privileges(
-                            group_name,
-                            schema=schema,
-                            obj_type="tables",
-                            privileges=set(),  # remove todos os defaults do grupo
+                    # Conjunto vazio remove todos os defaults do grupo
+                    with self.dao.savepoint("membership_defaults"):
+                        self.dao.alter_default_privileges_bulk(
+                            [
+                                (group_name, schema, "tables", set())
+                                for schema in self.dao.list_schemas()
+                            ],
                             for_role=username,
                         )
                 except Exception as e:
@@ -412,23 +432,13 @@ class RoleManager:
                 self.dao.add_user_to_group(username, new_group)
                 # Ajusta defaults: revoga do grupo antigo e aplica no novo para o usuário
                 try:
+                    entries = []
                     for schema in self.dao.list_schemas():
-                        # Revoga do grupo antigo
-                        self.dao.alter_default_privileges(
-                            old_group,
-                            schema=schema,
-                            obj_type="tables",
-                            privileges=set(),
-                            for_role=username,
-                        )
-                        # Concede no grupo novo (mínimo SELECT)
-                        self.dao.alter_default_privileges(
-                            new_group,
-                            schema=schema,
-                            obj_type="tables",
-                            privileges={"SELECT"},
-                            for_role=username,
-                        )
+                        # Revoga do grupo antigo e concede no novo (mínimo SELECT)
+                        entries.append((old_group, schema, "tables", set()))
+                        entries.append((new_group, schema, "tables", {"SELECT"}))
+                    with self.dao.savepoint("membership_defaults"):
+                        self.dao.alter_default_privileges_bulk(entries, for_role=username)
                 except Exception as e:
                     self.logger.warning(
                         f"[{self.operador}] Falha ao ajustar defaults FOR ROLE na transferência de '{username}': {e}"
@@ -502,6 +512,17 @@ class RoleManager:
             )
             return {}
 
+    def get_group_privileges_bulk(
+        self, group_names: List[str]
+    ) -> Dict[str, Dict[str, Dict[str, Set[str]]]]:
+        try:
+            return self.dao.get_group_privileges_bulk(group_names)
+        except Exception as e:
+            self.logger.error(
+                f"[{self.operador}] Erro ao obter privilégios dos grupos {group_names}: {e}"
+            )
+            return {g: {} for g in group_names}
+
     def set_group_privileges(
         self,
         group_name: str,
@@ -548,9 +569,7 @@ class RoleManager:
                     # usa-se a união dos privilégios reais (comportamento anterior).
                     if not future_privs and real_privs and not defaults_applied:
                         for schema, tables in real_privs.items():
-                            union_perms: Set[str] = set()
-                            for perms in tables.values():
-                                union_perms |= set(perms)
+                            union_perms: Set[str] = set().union(*tables.values())
                             try:
                                 self.dao.alter_default_privileges(group_name, schema, 'tables', union_perms)
                             except Exception as e:
@@ -560,9 +579,7 @@ class RoleManager:
                 elif obj_type_upper == 'SEQUENCE':
                     # Mantém lógica anterior para sequences
                     for schema, seqs in privileges.items():
-                        union_perms: Set[str] = set()
-                        for perms in seqs.values():
-                            union_perms |= set(perms)
+                        union_perms: Set[str] = set().union(*seqs.values())
                         try:
                             self.dao.alter_default_privileges(group_name, schema, 'sequences', union_perms)
                         except Exception as e:
@@ -618,12 +635,23 @@ class RoleManager:
             return False
 
     def alter_default_privileges(
-        self, group_name: str, schema: str, obj_type: str, privileges: Set[str]
+        self,
+        group_name: str,
+        schema: str,
+        obj_type: str,
+        privileges: Set[str],
+        for_role: str | None = None,
     ) -> bool:
-        """Configura ``ALTER DEFAULT PRIVILEGES`` para novos objetos."""
+        """Configura ``ALTER DEFAULT PRIVILEGES`` para novos objetos.
+
+        ``for_role`` é repassado ao DAO, que o emite como cláusula ``FOR ROLE``
+        no próprio comando (sem ``SET ROLE``/``RESET ROLE``).
+        """
         try:
             with self.dao.transaction():
-                self.dao.alter_default_privileges(group_name, schema, obj_type, privileges)
+                self.dao.alter_default_privileges(
+                    group_name, schema, obj_type, privileges, for_role=for_role
+                )
             self.logger.info(
                 f"[{self.operador}] Atualizou default privileges de '{obj_type}' no schema '{schema}' para o grupo '{group_name}'"
             )
@@ -650,7 +678,7 @@ class RoleManager:
             future_perms = tpl.get("future", {})
 
             with self.dao.transaction():
-                dbname = self.dao.conn.get_dsn_parameters().get("dbname")
+                dbname = self.dao.dbname
                 if "*" in db_perms:
                     self.dao.grant_database_privileges(group_name, set(db_perms["*"]))
                 elif dbname in db_perms:
@@ -714,27 +742,28 @@ class RoleManager:
                 except Exception:
                     members = []
                 # Derivar privilégios mínimos para tabelas a partir do template (se presente)
-                min_table_perms = set()
-                if "future" in tpl:
-                    for s, defs in tpl["future"].items():
-                        if "tables" in defs:
-                            min_table_perms |= set(defs["tables"])
+                min_table_perms = set().union(
+                    *(defs["tables"] for defs in tpl.get("future", {}).values() if "tables" in defs)
+                )
                 if not min_table_perms:
                     min_table_perms = {"SELECT"}
+                target_schemas = list(schema_perms.keys()) or ["public"]
                 for member in members:
-                    for schema in schema_perms.keys() or ["public"]:
-                        try:
-                            self.dao.alter_default_privileges(
-                                group_name,
-                                schema,
-                                "tables",
-                                min_table_perms,
+                    # Uma leitura e um único execute por membro (todos os schemas)
+                    try:
+                        # Savepoint: a falha de um membro não aborta o template inteiro
+                        with self.dao.savepoint("member_defaults"):
+                            self.dao.alter_default_privileges_bulk(
+                                [
+                                    (group_name, schema, "tables", min_table_perms)
+                                    for schema in target_schemas
+                                ],
                                 for_role=member,
                             )
-                        except Exception as e:
-                            self.logger.debug(
-                                f"[{self.operador}] Ignorando erro ao configurar defaults FOR ROLE '{member}' em '{schema}': {e}"
-                            )
+                    except Exception as e:
+                        self.logger.debug(
+                            f"[{self.operador}] Ignorando erro ao configurar defaults FOR ROLE '{member}' em {target_schemas}: {e}"
+                        )
 
             self.logger.info(
                 f"[{self.operador}] Aplicou template '{template}' ao grupo '{group_name}'"
@@ -765,17 +794,18 @@ class RoleManager:
             schemas = self.dao.list_schemas()
 
             with self.dao.transaction():
+                # Coleta privilégios atuais de todos os grupos em uma única consulta
+                current_by_group = self.dao.get_group_privileges_bulk(groups)
                 for group in groups:
-                    # Recoleta privilégios atuais do grupo (por tabela)
-                    current = self.dao.get_group_privileges(group)
+                    current = current_by_group.get(group, {})
                     # Reaplica (idempotente) para tabelas
                     if current:
-                        self.dao.apply_group_privileges(group, current, obj_type="TABLE")
+                        self.dao.apply_group_privileges(
+                            group, current, obj_type="TABLE", current=current
+                        )
                         # Ajusta default privileges (tabelas) por schema usando união dos privilégios
                         for schema, tbls in current.items():
-                            union_perms = set()
-                            for perms in tbls.values():
-                                union_perms |= set(perms)
+                            union_perms = set().union(*tbls.values())
                             try:
                                 self.dao.alter_default_privileges(group, schema, "tables", union_perms)
                             except Exception as e:
@@ -800,6 +830,7 @@ class RoleManager:
     # Sanitização
     # ------------------------------------------------------------------
     _RE_VALID = re.compile(r"[^a-z0-9_\.]+")
+    _RE_UNDERSCORES = re.compile(r"_+")
 
     def _truncate_identifier(self, name: str, limit: int = 63) -> str:
         if len(name) <= limit:
@@ -817,7 +848,7 @@ class RoleManager:
         username = self._basic_normalize(username)
         username = username.replace('-', '_').replace(' ', '_')
         username = self._RE_VALID.sub('_', username)
-        username = re.sub(r'_+', '_', username)
+        username = self._RE_UNDERSCORES.sub('_', username)
         username = username.strip('_')
         if not username:
             raise ValueError("Username inválido após sanitização.")
@@ -828,7 +859,7 @@ class RoleManager:
         group_name = self._basic_normalize(group_name)
         group_name = group_name.replace('-', '_').replace(' ', '_')
         group_name = self._RE_VALID.sub('_', group_name)
-        group_name = re.sub(r'_+', '_', group_name)
+        group_name = self._RE_UNDERSCORES.sub('_', group_name)
         group_name = group_name.strip('_')
         if not group_name:
             raise ValueError("Nome de grupo inválido após sanitização.")
@@ -20,7 +20,7 @@ from psycopg2 import sql
 
 from contracts.permission_contract import filter_managed
 
-from .db_manager import DBManager
+from .db_manager import DBManager, priv_label
 
 # ---------------------------------------------------------------------------
 # Generic helpers
@@ -116,7 +116,7 @@ def get_object_acls(
         cur.execute(query, (schema, objname))
         result: Dict[str, Set[str]] = {}
         for grantee, priv, grantable in cur.fetchall():
-            privname = priv + ("*" if grantable else "")
+            privname = priv_label(priv, grantable)
             result.setdefault(grantee, set()).add(privname)
     return result
 
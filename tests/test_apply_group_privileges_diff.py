@@ -81,6 +81,41 @@ class ApplyGroupPrivilegesDiffTests(unittest.TestCase):
             commands.extend(c.executed)
         self.assertEqual(commands, [])
 
+    def test_multiple_objects_single_execute(self):
+        conn = DummyConn({"public": {"t1": {"SELECT"}}})
+        dbm = DBManager(conn)
+        dbm.apply_group_privileges(
+            "grp",
+            {"public": {"t1": {"INSERT"}, "t2": {"SELECT"}}},
+            check_dependencies=False,
+        )
+        commands = []
+        for c in conn.cursors:
+            commands.extend(c.executed)
+        self.assertEqual(len(commands), 1)
+        self.assertEqual(commands[0].count("REVOKE"), 1)
+        self.assertEqual(commands[0].count("GRANT"), 2)
+
+    def test_invalid_privilege_sends_nothing(self):
+        conn = DummyConn({})
+        dbm = DBManager(conn)
+        with self.assertRaises(ValueError):
+            dbm.apply_group_privileges(
+                "grp", {"public": {"t1": {"SELECT"}, "t2": {"EXECUTE"}}}
+            )
+        commands = []
+        for c in conn.cursors:
+            commands.extend(c.executed)
+        self.assertEqual(commands, [])
+
+    def test_privilege_list_is_canonical_and_reused(self):
+        from gerenciador_postgres.db_manager import _privilege_list
+
+        first = _privilege_list(frozenset({"SELECT", "INSERT*"}))
+        again = _privilege_list(frozenset({"INSERT*", "SELECT"}))
+        self.assertIs(first, again)
+        self.assertEqual(first.as_string(None), "INSERT, SELECT")
+
 
 if __name__ == "__main__":
     unittest.main()
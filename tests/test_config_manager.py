@@ -74,3 +74,41 @@ def test_validate_config(monkeypatch):
     with pytest.raises(ValueError):
         cm.validate_config(invalid)
 
+
+
+def test_load_config_uses_c_loader_when_available(tmp_path, monkeypatch):
+    cm = load_module()
+    config_file = tmp_path / "config.yml"
+    config_file.write_text("log_level: WARNING\n", encoding="utf-8")
+    monkeypatch.setattr(cm, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(cm, "CONFIG_FILE", config_file)
+
+    assert cm._YAML_LOADER is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    assert cm.load_config()["log_level"] == "WARNING"
+
+
+def test_load_config_is_cached_until_file_changes(tmp_path, monkeypatch):
+    cm = load_module()
+    config_file = tmp_path / "config.yml"
+    config_file.write_text("log_level: WARNING\n", encoding="utf-8")
+    monkeypatch.setattr(cm, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(cm, "CONFIG_FILE", config_file)
+
+    calls = []
+    real_load = yaml.load
+
+    def counting_load(*args, **kwargs):
+        calls.append(True)
+        return real_load(*args, **kwargs)
+
+    monkeypatch.setattr(cm.yaml, "load", counting_load)
+
+    first = cm.load_config()
+    first["log_level"] = "CHANGED"
+    second = cm.load_config()
+    assert second["log_level"] == "WARNING"
+    assert len(calls) == 1
+
+    cm.save_config({"log_level": "ERROR"})
+    assert cm.load_config()["log_level"] == "ERROR"
+    assert len(calls) == 2
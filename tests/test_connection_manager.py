@@ -14,6 +14,7 @@ from gerenciador_postgres.connection_manager import (
     env_var_for_profile,
     resolve_password,
     _friendly_error,
+    _DummySignal,
 )
 
 
@@ -170,3 +171,40 @@ def test_resolve_password_env_over_keyring(monkeypatch):
 def test_friendly_error_messages(raw, expected):
     err = _friendly_error(OperationalError(raw))
     assert expected.lower() in str(err).lower()
+
+
+def test_singleton_is_shared_between_threads():
+    instances = []
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        instances.append(ConnectionManager())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len({id(i) for i in instances}) == 1
+
+
+def test_dummy_signal_slot_connected_during_emit_runs_next_time():
+    sig = _DummySignal()
+    calls = []
+
+    def late(value):
+        calls.append(("late", value))
+
+    def first(value):
+        calls.append(("first", value))
+        sig.connect(late)
+
+    sig.connect(first)
+    sig.emit(1)
+    assert calls == [("first", 1)]
+
+    calls.clear()
+    sig.emit(2)
+    assert calls[:2] == [("first", 2), ("late", 2)]
@@ -0,0 +1,15 @@
+import dataclasses
+
+import pytest
+
+from gerenciador_postgres.data_models import Group, User
+
+
+def test_models_are_slotted_and_immutable():
+    user = User(username="alice", oid=10, valid_until=None, can_login=True)
+    group = Group(group_name="grp_a", oid=20)
+
+    assert not hasattr(user, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        user.can_login = False
+    assert len({group, Group(group_name="grp_a", oid=20)}) == 1
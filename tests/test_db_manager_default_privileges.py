@@ -1,3 +1,4 @@
+import logging
 import unittest
 import sys
 import pathlib
@@ -82,6 +83,51 @@ class DBManagerDefaultPrivTests(unittest.TestCase):
         self.assertTrue(result)
         self.assertIsNone(self.conn.cursor_obj)
 
+    def test_alter_default_privileges_bulk_single_execute(self):
+        reads = []
+
+        def fake_get_default_privileges(owner=None, objtype="r", schema=None):
+            reads.append((owner, objtype))
+            return {"public": {"grp_old": {"SELECT"}}, "geo": {"grp_new": {"SELECT"}}}
+
+        self.dbm.get_default_privileges = fake_get_default_privileges
+        count = self.dbm.alter_default_privileges_bulk(
+            [
+                ("grp_old", "public", "tables", set()),
+                ("grp_new", "public", "tables", {"SELECT"}),
+                ("grp_old", "geo", "tables", set()),
+                ("grp_new", "geo", "tables", {"SELECT"}),
+            ],
+            for_role="alice",
+        )
+        self.assertEqual(count, 2)
+        self.assertEqual(reads, [("alice", "r")])
+        executed = self.conn.cursor_obj.executed
+        self.assertEqual(len(executed), 1)
+        self.assertIn("REVOKE", executed[0])
+        self.assertIn("GRANT", executed[0])
+
+    def test_alter_default_privileges_bulk_noop(self):
+        self.dbm.get_default_privileges = (
+            lambda owner=None, objtype="r", schema=None: {"public": {"grp": {"SELECT"}}}
+        )
+        count = self.dbm.alter_default_privileges_bulk(
+            [("grp", "public", "tables", {"SELECT"})]
+        )
+        self.assertEqual(count, 0)
+        self.assertIsNone(self.conn.cursor_obj)
+
+    def test_statement_not_rendered_when_debug_disabled(self):
+        from unittest import mock
+        from psycopg2 import sql
+
+        logger = logging.getLogger("gerenciador_postgres.db_manager")
+        with mock.patch.object(logger, "isEnabledFor", return_value=False), \
+                mock.patch.object(sql.Composed, "as_string") as as_string:
+            self.dbm.alter_default_privileges("grp", "public", "tables", {"SELECT"})
+        as_string.assert_not_called()
+        self.assertEqual(len(self.conn.cursor_obj.executed), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+from gerenciador_postgres.db_manager import DBManager
+
+
+class DummyCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+    def execute(self, query, params=None):
+        self.conn.executed.append((query, params))
+
+    def fetchall(self):
+        return [
+            ("grp_a", "public", "t1", "SELECT", False),
+            ("grp_a", "public", "t1", "INSERT", True),
+            ("grp_b", "geo", "t2", "SELECT", False),
+        ]
+
+
+class DummyConn:
+    def __init__(self):
+        self.executed = []
+
+    def cursor(self):
+        return DummyCursor(self)
+
+    def get_transaction_status(self):
+        return 0
+
+
+class GroupPrivilegesBulkTests(unittest.TestCase):
+    def test_single_query_for_all_groups(self):
+        conn = DummyConn()
+        dbm = DBManager(conn)
+
+        result = dbm.get_group_privileges_bulk(["grp_a", "grp_b", "grp_c"])
+
+        self.assertEqual(len(conn.executed), 1)
+        query, params = conn.executed[0]
+        self.assertIn("ANY(%s)", query)
+        self.assertEqual(params, (["grp_a", "grp_b", "grp_c"],))
+        self.assertEqual(
+            result,
+            {
+                "grp_a": {"public": {"t1": {"SELECT", "INSERT*"}}},
+                "grp_b": {"geo": {"t2": {"SELECT"}}},
+                "grp_c": {},
+            },
+        )
+
+    def test_empty_group_list_skips_query(self):
+        conn = DummyConn()
+        dbm = DBManager(conn)
+
+        self.assertEqual(dbm.get_group_privileges_bulk([]), {})
+        self.assertEqual(conn.executed, [])
+
+    def test_apply_with_prefetched_current_skips_read(self):
+        conn = DummyConn()
+        dbm = DBManager(conn)
+        current = {"public": {"t1": {"SELECT"}}}
+
+        dbm.apply_group_privileges("grp_a", current, current=current)
+        self.assertEqual(conn.executed, [])
+
+        dbm.apply_group_privileges(
+            "grp_a", {"public": {"t1": {"SELECT", "INSERT"}}}, current=current
+        )
+        # Apenas o GRANT da diferença; nenhuma leitura de privilégios
+        self.assertEqual(len(conn.executed), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
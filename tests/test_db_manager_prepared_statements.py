@@ -0,0 +1,138 @@
+import unittest
+
+import psycopg2
+
+from gerenciador_postgres.db_manager import DBManager
+
+
+class StatementMissing(psycopg2.Error):
+    pgcode = "26000"
+
+
+class DummyCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+    def execute(self, query, params=None):
+        self.conn.executed.append((query, params))
+        if query.startswith("EXECUTE") and self.conn.deallocated:
+            raise StatementMissing("prepared statement does not exist")
+        if query.startswith("PREPARE"):
+            self.conn.deallocated = False
+
+    def fetchall(self):
+        return [("alice",), ("bob",)]
+
+    def fetchone(self):
+        return ("alice", 10, None, True)
+
+
+class DummyConn:
+    def __init__(self, status=0):
+        self.executed = []
+        self.deallocated = False
+        self.status = status
+        self.rollbacks = 0
+
+    def cursor(self):
+        return DummyCursor(self)
+
+    def get_transaction_status(self):
+        return self.status
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class PreparedStatementTests(unittest.TestCase):
+    def test_prepare_once_per_connection(self):
+        conn = DummyConn()
+        dbm = DBManager(conn)
+
+        self.assertEqual(dbm.list_group_members("grp_a"), ["alice", "bob"])
+        self.assertEqual(dbm.list_group_members("grp_b"), ["alice", "bob"])
+
+        prepares = [q for q, _ in conn.executed if q.startswith("PREPARE list_group_members")]
+        executes = [(q, p) for q, p in conn.executed if q.startswith("EXECUTE")]
+        self.assertEqual(len(prepares), 1)
+        self.assertEqual(
+            executes,
+            [
+                ("EXECUTE list_group_members (%s)", ("grp_a",)),
+                ("EXECUTE list_group_members (%s)", ("grp_b",)),
+            ],
+        )
+
+    def test_new_connection_prepares_again(self):
+        conns = [DummyConn(), DummyConn()]
+        current = {"conn": conns[0]}
+        dbm = DBManager(lambda: current["conn"])
+
+        dbm.list_user_groups("alice")
+        current["conn"] = conns[1]
+        dbm.list_user_groups("alice")
+
+        for conn in conns:
+            prepares = [q for q, _ in conn.executed if q.startswith("PREPARE")]
+            self.assertEqual(len(prepares), 1)
+
+    def test_find_user_by_name_uses_prepared_statement(self):
+        conn = DummyConn()
+        dbm = DBManager(conn)
+
+        user = dbm.find_user_by_name("alice")
+        dbm.find_user_by_name("bob")
+
+        self.assertEqual(user.username, "alice")
+        prepares = [q for q, _ in conn.executed if q.startswith("PREPARE find_user_by_name")]
+        self.assertEqual(len(prepares), 1)
+        self.assertEqual(
+            [p for q, p in conn.executed if q.startswith("EXECUTE")],
+            [("alice",), ("bob",)],
+        )
+
+    def test_deallocated_statement_is_prepared_again(self):
+        conn = DummyConn()
+        dbm = DBManager(conn)
+
+        dbm.list_group_members("grp_a")
+        # DEALLOCATE ALL executado pelo console
+        conn.deallocated = True
+        self.assertEqual(dbm.list_group_members("grp_b"), ["alice", "bob"])
+
+        prepares = [q for q, _ in conn.executed if q.startswith("PREPARE")]
+        self.assertEqual(len(prepares), 2)
+        self.assertEqual(conn.rollbacks, 1)
+
+    def test_deallocated_statement_in_transaction_propagates(self):
+        conn = DummyConn(status=2)  # TRANSACTION_STATUS_INTRANS
+        dbm = DBManager(conn)
+        dbm._prepared[conn] = {"list_user_groups"}
+        conn.deallocated = True
+
+        with self.assertRaises(psycopg2.Error):
+            dbm._execute_prepared(conn, conn.cursor(), "list_user_groups", ("alice",))
+        self.assertEqual(conn.rollbacks, 0)
+        # Próxima chamada prepara de novo
+        self.assertNotIn("list_user_groups", dbm._prepared[conn])
+
+    def test_forget_prepared_statements(self):
+        conn = DummyConn()
+        dbm = DBManager(conn)
+
+        dbm.list_user_groups("alice")
+        dbm.forget_prepared_statements()
+        dbm.list_user_groups("alice")
+
+        prepares = [q for q, _ in conn.executed if q.startswith("PREPARE")]
+        self.assertEqual(len(prepares), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,10 +22,16 @@ class DummyCursor:
         pass
 
     def execute(self, sql, params=None):
-        if "FROM pg_namespace" in sql:
-            self.result = [(s,) for s in self.data["schemas"]]
-        elif "FROM pg_catalog.pg_class" in sql:
-            self.result = self.data["tables"]
+        self.data.setdefault("queries", []).append(sql)
+        if "FROM pg_catalog.pg_namespace n" in sql and "LEFT JOIN pg_catalog.pg_class" in sql:
+            # Emula o LEFT JOIN: schemas sem objetos retornam relname NULL
+            schemas = self.data["schemas"]
+            if "n.nspname = ANY(%s)" in sql:
+                schemas = [s for s in schemas if s in params[1]]
+            self.result = []
+            for schema in schemas:
+                tables = [(s, t) for s, t in self.data["tables"] if s == schema]
+                self.result.extend(tables or [(schema, None)])
         else:
             self.result = []
 
@@ -40,6 +46,9 @@ class DummyConn:
     def cursor(self):
         return DummyCursor(self.data)
 
+    def get_transaction_status(self):
+        return 0
+
 
 class DBManagerTableTests(unittest.TestCase):
     def setUp(self):
@@ -52,7 +61,35 @@ class DBManagerTableTests(unittest.TestCase):
     def test_list_tables_by_schema_includes_empty(self):
         expected = {"public": ["t1", "t2"], "empty_schema": []}
         self.assertEqual(self.dbm.list_tables_by_schema(), expected)
-
+        self.assertEqual(len(self.dbm.conn.data["queries"]), 1)
+
+    def test_list_tables_by_schema_keeps_requested_schemas(self):
+        result = self.dbm.list_tables_by_schema(include_schemas=["public", "missing"])
+        self.assertEqual(result, {"public": ["t1", "t2"], "missing": []})
+
+    def test_dashboard_counts_single_prepared_query(self):
+        executed = []
+
+        class Cursor(DummyCursor):
+            def execute(self, sql, params=None):
+                executed.append((sql, params))
+
+            def fetchone(self):
+                return (3, 2, 4, 10)
+
+        class Conn(DummyConn):
+            def cursor(self):
+                return Cursor(self.data)
+
+        dbm = DBManager(Conn({}))
+        self.assertEqual(dbm.dashboard_counts(prefix="grp_"), (3, 2, 4, 10))
+        self.assertEqual(dbm.dashboard_counts(prefix="grp_"), (3, 2, 4, 10))
+        prepares = [q for q, _ in executed if q.startswith("PREPARE dashboard_counts")]
+        self.assertEqual(len(prepares), 1)
+        self.assertEqual(
+            [(q, p) for q, p in executed if q.startswith("EXECUTE")],
+            [("EXECUTE dashboard_counts (%s)", ("grp_%",))] * 2,
+        )
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,8 +11,11 @@ class DummyConn:
     def __init__(self):
         self.committed = False
         self.rolled_back = False
+        self.executed = []
 
     def cursor(self):
+        conn = self
+
         class DummyCursor:
             def __enter__(self_inner):
                 return self_inner
@@ -21,7 +24,10 @@ class DummyConn:
                 pass
 
             def execute(self_inner, sql, params=None):
-                pass
+                # Composed([SQL('SAVEPOINT '), Identifier('sp')]) -> "SAVEPOINT sp"
+                conn.executed.append(
+                    "".join(getattr(p, "string", None) or ".".join(p.strings) for p in sql.seq)
+                )
 
         return DummyCursor()
 
@@ -50,6 +56,20 @@ class DBManagerTransactionTests(unittest.TestCase):
         self.assertFalse(self.conn.committed)
         self.assertTrue(self.conn.rolled_back)
 
+    def test_savepoint_failure_keeps_outer_transaction(self):
+        with self.dbm.transaction():
+            with self.assertRaises(ValueError):
+                with self.dbm.savepoint("sp"):
+                    raise ValueError("fail")
+        self.assertEqual(self.conn.executed, ["SAVEPOINT sp", "ROLLBACK TO SAVEPOINT sp"])
+        self.assertTrue(self.conn.committed)
+        self.assertFalse(self.conn.rolled_back)
+
+    def test_savepoint_released_on_success(self):
+        with self.dbm.savepoint("sp"):
+            pass
+        self.assertEqual(self.conn.executed, ["SAVEPOINT sp", "RELEASE SAVEPOINT sp"])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -62,6 +62,7 @@ def test_get_default_privileges_parsing():
         "UPDATE",
     }
     assert res["public"]["grp_Geo2_2025-2"] == {"SELECT"}
+    assert isinstance(res["public"]["grp_Geo2_2025-2"], frozenset)
     assert res["Teste_001_Esquema"]["grp_Geo2_2025-2"] == {
         "INSERT",
         "SELECT",
@@ -69,3 +70,18 @@ def test_get_default_privileges_parsing():
     }
     assert res["_meta"]["owner_roles"]["geo2"] == "postgres"
 
+
+
+def test_default_privileges_reuse_interned_labels():
+    # Strings novas a cada linha, como as devolvidas pelo driver
+    rows = [
+        ("postgres", "geo2", "grp_a", "".join(["SEL", "ECT"]), False),
+        ("postgres", "public", "grp_a", "".join(["SEL", "ECT"]), False),
+        ("postgres", "public", "grp_b", "INSERT", True),
+    ]
+    db = DBManager(DummyConn(rows))
+    res = db.get_default_privileges(owner="postgres")
+    (geo_priv,) = res["geo2"]["grp_a"]
+    (public_priv,) = res["public"]["grp_a"]
+    assert geo_priv is public_priv
+    assert res["public"]["grp_b"] == {"INSERT*"}
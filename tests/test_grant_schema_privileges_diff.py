@@ -98,6 +98,18 @@ class GrantSchemaPrivilegesDiffTests(unittest.TestCase):
         self.assertEqual(len(commands), 2)
         self.assertEqual(conn.grants[("grp", "public")], {"USAGE", "OTHER"})
 
+    def test_revoke_and_grant_sent_together(self):
+        grants = {("grp", "public"): {"USAGE"}}
+        conn = DummyConn(grants)
+        dbm = DBManager(conn)
+        dbm.grant_schema_privileges("grp", "public", {"CREATE", "USAGE*"})
+        commands = conn.last_cursor.commands
+        # SELECT dos privilégios atuais + um único envio com REVOKE e GRANTs
+        self.assertEqual(len(commands), 2)
+        self.assertIn("REVOKE USAGE ON SCHEMA", commands[1])
+        self.assertIn("GRANT CREATE ON SCHEMA", commands[1])
+        self.assertIn("WITH GRANT OPTION", commands[1])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,230 @@
+import pytest
+
+pytest.importorskip("PyQt6.QtCore")
+
+from gerenciador_postgres.controllers.groups_controller import GroupsController
+
+
+class DummyRoleManager:
+    def __init__(self):
+        self.swept = []
+
+    def sweep_privileges(self, target_group=None):
+        self.swept.append(target_group)
+        return True
+
+
+def test_current_database_is_read_once():
+    from gerenciador_postgres.db_manager import DBManager
+
+    calls = []
+
+    class Conn:
+        def cursor(self):
+            raise AssertionError("não deve consultar o banco")
+
+        def get_dsn_parameters(self):
+            calls.append(True)
+            return {"dbname": "db1"}
+
+    rm = DummyRoleManager()
+    rm.dao = DBManager(Conn())
+    controller = GroupsController(rm)
+
+    assert controller.get_current_database() == "db1"
+    assert controller.get_current_database() == "db1"
+    assert len(calls) == 1
+
+
+def test_default_table_privileges_for_group():
+    data = {
+        "public": {"grp_a": {"SELECT"}},
+        "extra": {"grp_b": {"INSERT"}},
+        "_meta": {"owner_roles": {"public": "owner1", "extra": "owner2"}},
+    }
+
+    class DAO:
+        def get_default_privileges(self, objtype="r"):
+            return data
+
+    rm = DummyRoleManager()
+    rm.dao = DAO()
+    controller = GroupsController(rm)
+
+    result = controller.get_default_table_privileges("grp_a")
+
+    assert result == {
+        "public": {"owner": "owner1", "privileges": {"SELECT"}},
+        "extra": {"owner": "owner2", "privileges": set()},
+    }
+    # O resultado do DAO não deve ser alterado
+    assert "_meta" in data
+
+
+def test_async_sweep_without_factory_runs_synchronously():
+    rm = DummyRoleManager()
+    controller = GroupsController(rm)
+    finished = []
+    emitted = []
+    controller.sweep_finished.connect(lambda g, ok, err: finished.append((g, ok, err)))
+    controller.data_changed.connect(lambda: emitted.append(True))
+
+    controller.sweep_group_privileges_async("grp_a")
+
+    # Sem conexão própria nada vai para o pool: resultado já disponível no retorno
+    assert controller._sweep_jobs == set()
+    assert rm.swept == ["grp_a"]
+    assert finished == [("grp_a", True, "")]
+    assert emitted == [True]
+
+
+def test_async_sweep_without_factory_reports_error_text():
+    class RM(DummyRoleManager):
+        def sweep_privileges(self, target_group=None):
+            raise RuntimeError("[WARN-DEPEND] public.t1 possui dependências")
+
+    controller = GroupsController(RM())
+    finished = []
+    controller.sweep_finished.connect(lambda g, ok, err: finished.append((g, ok, err)))
+
+    controller.sweep_group_privileges_async("grp_a")
+
+    assert finished == [("grp_a", False, "[WARN-DEPEND] public.t1 possui dependências")]
+
+
+def test_async_sweep_uses_dedicated_connection(monkeypatch):
+    from PyQt6.QtCore import QCoreApplication, QThreadPool
+    from gerenciador_postgres.controllers import groups_controller as module
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+
+    class Conn:
+        closed = 0
+
+        def cursor(self):
+            raise AssertionError("o sweep é simulado")
+
+        def close(self):
+            self.closed = 1
+
+    swept_on = []
+    audits = []
+
+    class FakeRoleManager:
+        def __init__(self, dao, logger, operador="sistema", audit_manager=None):
+            self.dao = dao
+            audits.append(audit_manager)
+
+        def sweep_privileges(self, target_group=None):
+            swept_on.append(self.dao.conn)
+            raise RuntimeError("falha no sweep")
+
+    monkeypatch.setattr(module, "RoleManager", FakeRoleManager)
+    rm = DummyRoleManager()
+    rm.logger = None
+    rm.operador = "op"
+    rm.audit_manager = object()  # ligado à conexão da UI
+    conns = []
+    controller = GroupsController(rm, connection_factory=lambda: conns.append(Conn()) or conns[-1])
+    finished = []
+    controller.sweep_finished.connect(lambda g, ok, err: finished.append((g, ok, err)))
+
+    controller.sweep_group_privileges_async("grp_a")
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+
+    # A conexão da interface (rm) não é usada e a dedicada é fechada mesmo com erro
+    assert rm.swept == []
+    assert swept_on == conns and len(conns) == 1
+    assert conns[0].closed == 1
+    assert audits == [None]
+    assert finished == [("grp_a", False, "falha no sweep")]
+
+
+def test_schema_level_privileges_db_error_returns_empty():
+    import psycopg2
+
+    class DAO:
+        def get_schema_privileges(self, group):
+            raise psycopg2.OperationalError("conexão perdida")
+
+    rm = DummyRoleManager()
+    rm.dao = DAO()
+    controller = GroupsController(rm)
+
+    assert controller.get_schema_level_privileges("grp_a") == {}
+
+
+def test_schema_level_privileges_propagates_programming_errors():
+    class DAO:
+        def get_schema_privileges(self, group):
+            raise TypeError("bug")
+
+    rm = DummyRoleManager()
+    rm.dao = DAO()
+    controller = GroupsController(rm)
+
+    with pytest.raises(TypeError):
+        controller.get_schema_level_privileges("grp_a")
+
+
+def test_default_table_privileges_ignores_reentrant_call():
+    rm = DummyRoleManager()
+    controller = GroupsController(rm)
+
+    class DAO:
+        def get_default_privileges(self, objtype="r"):
+            # Chamada concorrente enquanto a primeira ainda está em andamento
+            assert controller.get_default_table_privileges("grp_a") == {}
+            return {"public": {"grp_a": {"SELECT"}}, "_meta": {}}
+
+    rm.dao = DAO()
+
+    result = controller.get_default_table_privileges("grp_a")
+
+    assert result == {"public": {"owner": None, "privileges": {"SELECT"}}}
+    assert controller._refresh_lock.acquire(blocking=False)
+
+
+def test_default_privileges_read_is_cached_until_data_changed():
+    calls = []
+
+    class DAO:
+        def get_default_privileges(self, objtype="r"):
+            calls.append(objtype)
+            return {"public": {"grp_a": {"SELECT"}}, "_meta": {}}
+
+    rm = DummyRoleManager()
+    rm.dao = DAO()
+    controller = GroupsController(rm)
+
+    controller.get_default_table_privileges("grp_a")
+    controller.get_default_table_privileges("grp_b")
+    assert calls == ["r"]
+
+    controller.data_changed.emit()
+    controller.get_default_table_privileges("grp_a")
+    assert calls == ["r", "r"]
+
+
+def test_list_groups_is_cached_until_data_changed():
+    class RM(DummyRoleManager):
+        def __init__(self):
+            super().__init__()
+            self.calls = 0
+
+        def list_groups(self):
+            self.calls += 1
+            return ["grp_a", "grp_b"]
+
+    rm = RM()
+    controller = GroupsController(rm)
+
+    groups = controller.list_groups()
+    groups.append("mutated")
+    assert controller.list_groups() == ["grp_a", "grp_b"]
+    assert rm.calls == 1
+
+    controller.data_changed.emit()
+    controller.list_groups()
+    assert rm.calls == 2
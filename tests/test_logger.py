@@ -0,0 +1,14 @@
+import logging
+
+from gerenciador_postgres import logger as app_logger
+
+
+def test_ensure_logger_configures_once():
+    app_logger.ensure_logger()
+    handlers = list(app_logger._own_handlers)
+    assert handlers
+
+    app_logger.ensure_logger()
+
+    assert app_logger._own_handlers == handlers
+    assert all(h in logging.getLogger().handlers for h in handlers)
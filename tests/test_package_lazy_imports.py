@@ -0,0 +1,16 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_submodules_load_on_first_access():
+    code = (
+        "import sys, gerenciador_postgres as g\n"
+        "assert 'gerenciador_postgres.executor' not in sys.modules\n"
+        "assert g.executor.__name__ == 'gerenciador_postgres.executor'\n"
+        "from gerenciador_postgres import reconciler\n"
+        "assert 'gerenciador_postgres.reconciler' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
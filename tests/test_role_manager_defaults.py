@@ -13,8 +13,9 @@ class DummyDAO:
     def apply_group_privileges(self, group, privileges, obj_type="TABLE", check_dependencies=True):
         pass
 
-    def alter_default_privileges(self, group, schema, obj_type, privileges):
+    def alter_default_privileges(self, group, schema, obj_type, privileges, for_role=None):
         self.default_privs.append((group, schema, obj_type, privileges))
+        self.for_role = for_role
 
     @contextmanager
     def transaction(self):
@@ -56,6 +57,14 @@ class RoleManagerDefaultsTests(unittest.TestCase):
         )
         self.assertEqual(len(self.dao.default_privs), initial)
 
+    def test_alter_default_privileges_passes_owner(self):
+        ok = self.rm.alter_default_privileges(
+            "grp", "public", "tables", {"SELECT"}, for_role="owner1"
+        )
+        self.assertTrue(ok)
+        self.assertEqual(self.dao.default_privs, [("grp", "public", "tables", {"SELECT"})])
+        self.assertEqual(self.dao.for_role, "owner1")
+
 
 if __name__ == "__main__":
     unittest.main()
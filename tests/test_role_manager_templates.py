@@ -7,6 +7,8 @@ from config.permission_templates import PERMISSION_TEMPLATES
 
 
 class DummyDAO:
+    dbname = "testdb"
+
     def __init__(self):
         self.conn = DummyConn()
         self.applied = None
@@ -27,6 +29,12 @@ class DummyDAO:
     def alter_default_privileges(self, group, schema, obj_type, privileges):
         self.default_privs.append((group, schema, obj_type, privileges))
 
+    def list_group_members(self, group):
+        return getattr(self, "members", [])
+
+    def alter_default_privileges_bulk(self, entries, for_role=None):
+        self.bulk_calls = getattr(self, "bulk_calls", []) + [(for_role, list(entries))]
+
     @contextmanager
     def transaction(self):
         try:
@@ -36,6 +44,14 @@ class DummyDAO:
             self.conn.rollback()
             raise
 
+    @contextmanager
+    def savepoint(self, name):
+        try:
+            yield
+        except Exception:
+            self.savepoint_rollbacks = getattr(self, "savepoint_rollbacks", 0) + 1
+            raise
+
 
 class DummyConn:
     def __init__(self):
@@ -73,6 +89,32 @@ class RoleManagerTemplateTests(unittest.TestCase):
         self.assertIn(("grp_demo", "public", "tables", set(fut)), self.dao.default_privs)
         self.assertTrue(self.dao.conn.committed)
 
+    def test_apply_template_batches_member_defaults(self):
+        template = next(iter(PERMISSION_TEMPLATES))
+        self.dao.members = ["alice", "bob"]
+        self.assertTrue(self.rm.apply_template_to_group("grp_demo", template))
+        self.assertEqual([owner for owner, _ in self.dao.bulk_calls], ["alice", "bob"])
+        for _, entries in self.dao.bulk_calls:
+            self.assertTrue(entries)
+            self.assertTrue(all(e[0] == "grp_demo" and e[2] == "tables" for e in entries))
+
+    def test_member_defaults_failure_is_isolated(self):
+        template = next(iter(PERMISSION_TEMPLATES))
+        self.dao.members = ["alice", "bob"]
+        calls = []
+
+        def bulk(entries, for_role=None):
+            calls.append(for_role)
+            if for_role == "alice":
+                raise RuntimeError("permission denied")
+
+        self.dao.alter_default_privileges_bulk = bulk
+        self.assertTrue(self.rm.apply_template_to_group("grp_demo", template))
+        # Falha de 'alice' desfeita no savepoint; 'bob' e o template seguem
+        self.assertEqual(calls, ["alice", "bob"])
+        self.assertEqual(self.dao.savepoint_rollbacks, 1)
+        self.assertTrue(self.dao.conn.committed)
+
 
 if __name__ == "__main__":
     unittest.main()
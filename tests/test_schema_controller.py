@@ -0,0 +1,33 @@
+import logging
+
+import pytest
+
+pytest.importorskip("PyQt6.QtCore")
+
+from gerenciador_postgres.controllers.schema_controller import SchemaController
+
+
+class DummySchemaManager:
+    def __init__(self):
+        self.calls = 0
+        self.created = []
+
+    def list_schemas(self):
+        self.calls += 1
+        return ["public"] + self.created
+
+    def create_schema(self, name, owner=None):
+        self.created.append(name)
+
+
+def test_list_schemas_cached_until_change():
+    sm = DummySchemaManager()
+    controller = SchemaController(sm, logging.getLogger("test"))
+
+    assert controller.list_schemas() == ["public"]
+    assert controller.list_schemas() == ["public"]
+    assert sm.calls == 1
+
+    controller.create_schema("geo")
+    assert controller.list_schemas() == ["public", "geo"]
+    assert sm.calls == 2
@@ -0,0 +1,77 @@
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+import psycopg2
+from PyQt6 import sip
+from PyQt6.QtWidgets import QApplication
+
+from gerenciador_postgres.gui.sql_console_view import SQLConsoleView
+
+
+class DummyCursor:
+    description = None
+    rowcount = 0
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, stmt):
+        if self.conn.fail:
+            raise psycopg2.ProgrammingError("erro")
+        self.conn.executed.append(stmt)
+
+    def close(self):
+        pass
+
+
+class DummyConn:
+    closed = 0
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.executed = []
+        self.commits = 0
+
+    def cursor(self):
+        return DummyCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+class DummyDBManager:
+    def __init__(self, conn):
+        self.conn = conn
+        self.forgotten = []
+
+    def forget_prepared_statements(self, conn=None):
+        self.forgotten.append(conn)
+
+
+def _run(conn):
+    app = QApplication.instance() or QApplication([])
+    dbm = DummyDBManager(conn)
+    view = SQLConsoleView(dbm)
+    emitted = []
+    view.executed.connect(lambda: emitted.append(True))
+    view.txtSQL.setPlainText("GRANT SELECT ON t1 TO grp_a; DROP ROLE grp_b")
+    view.on_execute()
+    app.processEvents()
+    # Destrói a view enquanto a QApplication existe (e não num gc posterior)
+    sip.delete(view)
+    # O console pode ter rodado DEALLOCATE/DISCARD ALL, com ou sem erro
+    assert dbm.forgotten == [conn]
+    return emitted
+
+
+def test_successful_execution_emits_executed():
+    conn = DummyConn()
+    assert _run(conn) == [True]
+    assert conn.commits == 1
+
+
+def test_failed_execution_does_not_emit():
+    assert _run(DummyConn(fail=True)) == []
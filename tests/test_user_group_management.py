@@ -26,8 +26,12 @@ class DummyDAO:
         return ["grp_a", "grp_b"]
 
     def find_user_by_name(self, username):
+        self.lookups = getattr(self, "lookups", 0) + 1
         return self.users.get(username)
 
+    def list_all_roles(self, include_internal=False):
+        return sorted(self.users) + self.list_groups()
+
     def insert_user(self, username, password, valid_until=None):
         self.users[username] = {
             'password': password,
@@ -47,6 +51,14 @@ class DummyDAO:
             self.conn.rollback()
             raise
 
+    @contextmanager
+    def savepoint(self, name):
+        try:
+            yield
+        except Exception:
+            self.savepoint_rollbacks = getattr(self, "savepoint_rollbacks", 0) + 1
+            raise
+
 
 class DummyConn:
     def __init__(self):
@@ -93,6 +105,33 @@ class UserGroupManagementTests(unittest.TestCase):
         self.assertEqual(self.dao.users["jose"]["password"], "111")
         self.assertEqual(self.dao.users["jose.angelo"]["valid_until"], "2024-06-30")
 
+    def test_create_users_batch_prefetches_roles(self):
+        self.uc.create_user('jose', 'pw')
+        self.dao.lookups = 0
+        data = [("111", "José Silva"), ("222", "José Ângelo"), ("333", "José Ângelo")]
+        created = self.uc.create_users_batch(data)
+        self.assertEqual(created, ["jose.silva", "jose.angelo", "jose.angelo2"])
+        # Apenas a checagem de create_user para cada usuário efetivamente criado
+        self.assertEqual(self.dao.lookups, 3)
+
+    def test_list_users_is_cached_until_change(self):
+        calls = []
+        self.dao.list_users = lambda: calls.append(True) or sorted(self.dao.users)
+
+        self.assertEqual(self.uc.list_users(), [])
+        self.assertEqual(self.uc.list_users(), [])
+        self.assertEqual(len(calls), 1)
+
+        self.uc.create_user('alice', 'pw')
+        self.assertEqual(self.uc.list_users(), ['alice'])
+        self.assertEqual(len(calls), 2)
+
+        # SQL externo (console) não passa pelo controller
+        self.dao.users['bob'] = {}
+        self.uc.invalidate_cache()
+        self.assertEqual(self.uc.list_users(), ['alice', 'bob'])
+        self.assertEqual(len(calls), 3)
+
     def test_renew_user_validity(self):
         self.uc.create_user('alice', 'pw', '2025-12-31')
         self.assertTrue(self.uc.renew_user_validity('alice', '2026-01-01'))
@@ -106,6 +145,61 @@ class UserGroupManagementTests(unittest.TestCase):
         self.assertEqual(created, ["jose"])
         self.assertEqual(self.dao.users['jose']['valid_until'], '2024-06-30')
 
+    def test_notifications_are_coalesced(self):
+        data_events = []
+        member_events = []
+        self.uc.data_changed.connect(lambda: data_events.append(True))
+        self.uc.members_changed.connect(member_events.append)
+
+        self.uc.create_user('alice', 'pw')
+        self.uc.create_user('bob', 'pw')
+        self.uc.add_user_to_group('alice', 'grp_a')
+        self.uc.transfer_user_group('alice', 'grp_a', 'grp_b')
+        self.assertEqual(data_events, [])
+
+        self.uc.flush()
+        self.assertEqual(data_events, [True])
+        self.assertEqual(member_events, ['grp_a', 'grp_b'])
+
+    def test_membership_survives_default_privileges_failure(self):
+        self.dao.list_schemas = lambda: ["public"]
+
+        def failing_bulk(entries, for_role=None):
+            raise RuntimeError("permission denied for schema public")
+
+        self.dao.alter_default_privileges_bulk = failing_bulk
+        self.assertTrue(self.rm.add_user_to_group("alice", "grp_a"))
+        self.assertTrue(self.rm.transfer_user_group("alice", "grp_a", "grp_b"))
+        self.assertTrue(self.rm.remove_user_from_group("alice", "grp_b"))
+
+        # Só o savepoint é desfeito; a transação de pertencimento é confirmada
+        self.assertEqual(self.dao.savepoint_rollbacks, 3)
+        self.assertTrue(self.dao.conn.committed)
+        self.assertFalse(self.dao.conn.rolled_back)
+        self.assertEqual(self.dao.list_user_groups("alice"), [])
+
+    def test_deleting_group_with_members_refreshes_user_list(self):
+        from gerenciador_postgres.controllers.groups_controller import GroupsController
+        from gerenciador_postgres.gui.main_window import connect_controller_caches
+
+        gc = GroupsController(self.rm)
+        connect_controller_caches(self.uc, gc)
+        self.dao.list_users = lambda: sorted(self.dao.users)
+
+        self.uc.create_user('alice', 'pw')
+        self.uc.add_user_to_group('alice', 'grp_a')
+        self.assertEqual(self.uc.list_users(), ['alice'])
+
+        def delete_group_and_members(group):
+            for user, groups in self.dao.members.items():
+                if group in groups:
+                    self.dao.users.pop(user, None)
+            return True
+
+        self.rm.delete_group_and_members = delete_group_and_members
+        self.assertTrue(gc.delete_group_and_members('grp_a'))
+        self.assertEqual(self.uc.list_users(), [])
+
 
 if __name__ == "__main__":
     unittest.main()